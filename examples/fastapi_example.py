@@ -23,6 +23,7 @@ tracker = ErrorTracker(
     environment="development",
     release="1.0.0",
     debug=True,  # Enable debug mode to see events in console
+    background=True,  # Send events from a worker thread so handlers don't block
     # auth_token="your_token_here",  # Required for XrayRadar authentication
 )
 
@@ -236,8 +237,8 @@ async def manual_error():
         return {"message": "Operation succeeded!"}
 
     except Exception as e:
-        # Manually capture the exception with context
-        event_id = tracker.capture_exception(
+        # Manually capture the exception with context (without blocking the event loop)
+        event_id = await tracker.acapture_exception(
             e,
             endpoint="/manual-error",
             random_seed=True
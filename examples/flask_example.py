@@ -18,6 +18,7 @@ tracker = ErrorTracker(
     environment="development",
     release="1.0.0",
     debug=True,  # Enable debug mode to see events in console
+    background=True,  # Send events from a worker thread so handlers don't block
     # auth_token="your_token_here",  # Required for XrayRadar authentication
 )
 
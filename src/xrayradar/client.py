@@ -3,16 +3,42 @@ Main client for the error tracking SDK
 """
 
 import atexit
+from collections import deque
+from dataclasses import replace
 from datetime import datetime, timezone
+import functools
 import logging
 import os
+import secrets
 import sys
 import threading
-from typing import Any, Callable, Dict, List, Optional
+import time
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Tuple, Union
 import weakref
 
-from .models import Breadcrumb, Context, Event, Level, Request, User
-from .transport import DebugTransport, HttpTransport, NullTransport, Transport
+from .models import Breadcrumb, Context, Event, Level, Request, User, _new_event_id
+from .transport import (
+    BackgroundTransport,
+    DebugTransport,
+    HttpTransport,
+    NullTransport,
+    Transport,
+)
+
+# Shared CSPRNG for sampling decisions (only consulted for 0 < sample_rate < 1)
+_sample_random = secrets.SystemRandom()
+
+# Seconds close() (also run at interpreter exit) waits for pending events
+_CLOSE_FLUSH_TIMEOUT = 2.0
+
+
+async def _run_in_executor(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking call in the event loop's default executor"""
+    # Imported here so that `import xrayradar` does not load asyncio
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
 
 
 def _close_weak_client(client_ref: "weakref.ReferenceType[ErrorTracker]") -> None:
@@ -51,6 +77,8 @@ class ErrorTracker:
         transport: Optional[Transport] = None,
         auto_enabling_integrations: bool = True,
         send_default_pii: bool = False,
+        background: bool = False,
+        breadcrumb_rate_limit: Optional[float] = None,
         **kwargs,
     ):
         """
@@ -67,6 +95,11 @@ class ErrorTracker:
             before_send: Callback to modify events before sending
             transport: Custom transport implementation
             auto_enabling_integrations: Whether to auto-enable framework integrations
+            background: Send events from a background worker thread instead of
+                the calling thread (pending events are flushed on close)
+            breadcrumb_rate_limit: Maximum breadcrumbs per second (bursts of up to
+                twice this are allowed); extra breadcrumbs are dropped and the count
+                is reported in the next event's "dropped_breadcrumbs" tag. None disables it.
         """
         # Reconfigure singleton on every init call (tests expect independent configs
         # across instantiations while still using the singleton instance).
@@ -90,8 +123,13 @@ class ErrorTracker:
 
         # State
         self._enabled = bool(dsn or debug or transport)
-        self._breadcrumbs: List[Breadcrumb] = []
+        self._breadcrumbs: Deque[Breadcrumb] = deque(
+            maxlen=max(0, max_breadcrumbs))
         self._context = Context()
+        self._breadcrumb_rate = breadcrumb_rate_limit
+        self._breadcrumb_tokens = 2 * (breadcrumb_rate_limit or 0.0)
+        self._breadcrumb_last = time.monotonic()
+        self._dropped_breadcrumbs = 0
         self._logger = logging.getLogger(__name__)
 
         # Initialize transport
@@ -104,6 +142,9 @@ class ErrorTracker:
         else:
             self._transport = NullTransport()
 
+        if background and not isinstance(self._transport, NullTransport):
+            self._transport = BackgroundTransport(self._transport)
+
         # Set default context
         self._context.environment = self.environment
         self._context.release = self.release
@@ -136,7 +177,7 @@ class ErrorTracker:
     def capture_exception(
         self,
         exception: Optional[Exception] = None,
-        level: Level = Level.ERROR,
+        level: Union[Level, str] = Level.ERROR,
         message: Optional[str] = None,
         **extra_context,
     ) -> Optional[str]:
@@ -169,6 +210,9 @@ class ErrorTracker:
                     "from within an except block.")
             exception = exc_info[1]
 
+        if not isinstance(level, Level):
+            level = Level(level)
+
         # Create event
         event = Event.from_exception(exception, level, message, self._context)
 
@@ -177,7 +221,7 @@ class ErrorTracker:
             event.contexts.extra.update(extra_context)
 
         # Add breadcrumbs
-        event.breadcrumbs = self._breadcrumbs.copy()
+        event.breadcrumbs, dropped_breadcrumbs = self._take_breadcrumbs()
 
         # Apply fingerprint if needed
         if not event.fingerprint:
@@ -196,6 +240,8 @@ class ErrorTracker:
         # Send event
         try:
             event_data = self._sanitize_event_data(event.to_dict())
+            if dropped_breadcrumbs:
+                self._tag_dropped_breadcrumbs(event_data, dropped_breadcrumbs)
             self._transport.send_event(event_data)
             return event.event_id
         except Exception as e:
@@ -205,7 +251,7 @@ class ErrorTracker:
     def capture_message(
         self,
         message: str,
-        level: Level = Level.ERROR,
+        level: Union[Level, str] = Level.ERROR,
         **extra_context,
     ) -> Optional[str]:
         """
@@ -226,11 +272,12 @@ class ErrorTracker:
         if not self._should_sample():
             return None
 
-        import uuid
+        if not isinstance(level, Level):
+            level = Level(level)
 
         # Create event
         event = Event(
-            event_id=str(uuid.uuid4()),
+            event_id=_new_event_id(),
             timestamp=datetime.now(timezone.utc),
             level=level,
             message=message,
@@ -242,7 +289,7 @@ class ErrorTracker:
             event.contexts.extra.update(extra_context)
 
         # Add breadcrumbs
-        event.breadcrumbs = self._breadcrumbs.copy()
+        event.breadcrumbs, dropped_breadcrumbs = self._take_breadcrumbs()
 
         # Apply fingerprint
         event.fingerprint = [message]
@@ -260,18 +307,57 @@ class ErrorTracker:
         # Send event
         try:
             event_data = self._sanitize_event_data(event.to_dict())
+            if dropped_breadcrumbs:
+                self._tag_dropped_breadcrumbs(event_data, dropped_breadcrumbs)
             self._transport.send_event(event_data)
             return event.event_id
         except Exception as e:
             self._logger.error(f"Failed to send event: {e}")
             return None
 
+    async def acapture_exception(
+        self,
+        exception: Optional[Exception] = None,
+        level: Union[Level, str] = Level.ERROR,
+        message: Optional[str] = None,
+        **extra_context,
+    ) -> Optional[str]:
+        """
+        Capture an exception from async code without blocking the event loop
+
+        Accepts the same arguments as capture_exception; the capture runs in
+        the loop's default executor.
+        """
+        if exception is None:
+            # Resolve the current exception here: sys.exc_info() is per-thread.
+            exception = sys.exc_info()[1]
+            if exception is None:
+                return self.capture_exception()
+
+        return await _run_in_executor(
+            self.capture_exception, exception, level, message, **extra_context)
+
+    async def acapture_message(
+        self,
+        message: str,
+        level: Union[Level, str] = Level.ERROR,
+        **extra_context,
+    ) -> Optional[str]:
+        """
+        Capture a message from async code without blocking the event loop
+
+        Accepts the same arguments as capture_message; the capture runs in
+        the loop's default executor.
+        """
+        return await _run_in_executor(
+            self.capture_message, message, level, **extra_context)
+
     def add_breadcrumb(
         self,
         message: str,
         category: Optional[str] = None,
-        level: Optional[Level] = None,
-        data: Optional[Dict[str, Any]] = None,
+        level: Optional[Union[Level, str]] = None,
+        data: Optional[Mapping[str, Any]] = None,
         timestamp: Optional[datetime] = None,
         type: Optional[str] = None,
     ) -> None:
@@ -282,13 +368,19 @@ class ErrorTracker:
             message: Breadcrumb message
             category: Breadcrumb category
             level: Breadcrumb level
-            data: Additional data
+            data: Additional data (stored as given, not copied; treated as read-only)
             timestamp: Timestamp (defaults to now)
             type: Breadcrumb type (default, http, navigation, ui, console, error, query, user)
         """
         if not self._enabled:
             return
 
+        if self._breadcrumb_rate is not None and not self._take_breadcrumb_token():
+            return
+
+        if level is not None and not isinstance(level, Level):
+            level = Level(level)
+
         breadcrumb = Breadcrumb(
             timestamp=timestamp or datetime.now(timezone.utc),
             message=message,
@@ -298,11 +390,40 @@ class ErrorTracker:
             type=type,
         )
 
+        # The deque is bounded, so the oldest breadcrumb is evicted automatically
         with self._lock:
             self._breadcrumbs.append(breadcrumb)
-            # Keep only the most recent breadcrumbs
-            if len(self._breadcrumbs) > self.max_breadcrumbs:
-                self._breadcrumbs = self._breadcrumbs[-self.max_breadcrumbs:]
+
+    def _take_breadcrumb_token(self) -> bool:
+        """Token bucket for breadcrumb_rate_limit; counts rejected breadcrumbs"""
+        now = time.monotonic()
+        rate = self._breadcrumb_rate
+        with self._lock:
+            self._breadcrumb_tokens = min(
+                2 * rate, self._breadcrumb_tokens + (now - self._breadcrumb_last) * rate)
+            self._breadcrumb_last = now
+            if self._breadcrumb_tokens < 1:
+                self._dropped_breadcrumbs += 1
+                return False
+            self._breadcrumb_tokens -= 1
+            return True
+
+    def _take_breadcrumbs(self) -> Tuple[List[Breadcrumb], int]:
+        """Snapshot breadcrumbs for an event and reset the dropped counter"""
+        with self._lock:
+            dropped = self._dropped_breadcrumbs
+            self._dropped_breadcrumbs = 0
+            breadcrumbs = list(self._breadcrumbs)
+
+        if self.before_send:
+            # before_send may scrub breadcrumb data in place; give it dicts
+            # instead of read-only mappings (e.g. those shared by the logging
+            # integration).
+            breadcrumbs = [
+                crumb if type(crumb.data) is dict else replace(crumb, data=dict(crumb.data))
+                for crumb in breadcrumbs
+            ]
+        return breadcrumbs, dropped
 
     def set_user(self, **user_data) -> None:
         """Set user context"""
@@ -349,7 +470,7 @@ class ErrorTracker:
 
     def close(self) -> None:
         """Close the client and cleanup resources"""
-        self.flush()
+        self.flush(_CLOSE_FLUSH_TIMEOUT)
         if hasattr(self._transport, "close"):
             self._transport.close()
 
@@ -422,6 +543,14 @@ class ErrorTracker:
         sanitized["contexts"] = contexts
         return sanitized
 
+    def _tag_dropped_breadcrumbs(self, event_data: Dict[str, Any], dropped: int) -> None:
+        """Record rate-limited breadcrumbs on the event without touching shared tags"""
+        contexts = event_data.get("contexts") or {}
+        tags = dict(contexts.get("tags") or {})
+        tags["dropped_breadcrumbs"] = str(dropped)
+        contexts["tags"] = tags
+        event_data["contexts"] = contexts
+
     def _filter_headers(self, headers: Dict[str, Any]) -> Dict[str, Any]:
         sensitive = {
             "authorization",
@@ -439,8 +568,11 @@ class ErrorTracker:
 
     def _should_sample(self) -> bool:
         """Check if the event should be sampled"""
-        import secrets
-        return secrets.SystemRandom().random() < self.sample_rate
+        if self.sample_rate >= 1.0:
+            return True
+        if self.sample_rate <= 0.0:
+            return False
+        return _sample_random.random() < self.sample_rate
 
     def _generate_fingerprint(self, event: Event) -> List[str]:
         """Generate fingerprint for event"""
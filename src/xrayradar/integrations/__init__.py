@@ -1,43 +1,84 @@
 """
 Framework integrations for xrayradar
+
+Integrations are imported lazily on first attribute access (PEP 562), so
+``import xrayradar.integrations`` does not pay for probing every supported
+framework when an application only uses one of them. Applications that want
+the import cost paid up front can call ``preload_integrations()`` at startup.
 """
 
-__all__ = []
-
-try:
-    from .flask import FlaskIntegration
-    __all__.append("FlaskIntegration")
-except ImportError:  # pragma: no cover
-    FlaskIntegration = None  # pragma: no cover
-
-try:
-    from .django import DjangoIntegration
-    __all__.append("DjangoIntegration")
-except ImportError:  # pragma: no cover
-    DjangoIntegration = None  # pragma: no cover
-
-try:
-    from .fastapi import FastAPIIntegration
-    __all__.append("FastAPIIntegration")
-except ImportError:  # pragma: no cover
-    FastAPIIntegration = None  # pragma: no cover
-
-try:
-    from .graphene import GrapheneIntegration
-    __all__.append("GrapheneIntegration")
-except ImportError:  # pragma: no cover
-    GrapheneIntegration = None  # pragma: no cover
-
-try:
-    from .drf import make_drf_exception_handler
-    __all__.append("make_drf_exception_handler")
-except ImportError:  # pragma: no cover
-    make_drf_exception_handler = None  # pragma: no cover
-
-try:
-    from .logging import LoggingIntegration, setup_logging
-    __all__.append("LoggingIntegration")
-    __all__.append("setup_logging")
-except ImportError:  # pragma: no cover
-    LoggingIntegration = None  # pragma: no cover
-    setup_logging = None  # pragma: no cover
+import importlib
+import importlib.util
+from typing import Any, Dict, List, Optional, Tuple
+
+# Public name -> (submodule, attribute)
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "FlaskIntegration": (".flask", "FlaskIntegration"),
+    "DjangoIntegration": (".django", "DjangoIntegration"),
+    "FastAPIIntegration": (".fastapi", "FastAPIIntegration"),
+    "GrapheneIntegration": (".graphene", "GrapheneIntegration"),
+    "make_drf_exception_handler": (".drf", "make_drf_exception_handler"),
+    "LoggingIntegration": (".logging", "LoggingIntegration"),
+    "setup_logging": (".logging", "setup_logging"),
+}
+
+# Submodule -> third-party package it needs (None = stdlib only)
+_REQUIRES: Dict[str, Optional[str]] = {
+    ".flask": "flask",
+    ".django": "django",
+    ".fastapi": "fastapi",
+    ".graphene": "graphene",
+    ".drf": "rest_framework",
+    ".logging": None,
+}
+
+__all__ = list(_LAZY) + ["preload_integrations"]
+
+
+def __getattr__(name: str) -> Any:
+    spec = _LAZY.get(name)
+    if spec is None:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(spec[0], __name__)
+    value = getattr(module, spec[1])
+    # Cache on the package so later lookups bypass __getattr__.
+    globals()[name] = value
+    return value
+
+
+def _is_available(submodule: str) -> bool:
+    requirement = _REQUIRES.get(submodule)
+    return requirement is None or importlib.util.find_spec(requirement) is not None
+
+
+def preload_integrations() -> List[str]:
+    """
+    Import every integration whose framework is installed, concurrently
+
+    Framework imports are mostly filesystem work, so running them on a small
+    thread pool overlaps them instead of paying for each one in turn.
+    Integrations whose framework is missing are skipped.
+
+    Returns:
+        Names of the integration submodules that were loaded (e.g. ["flask", "logging"])
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    submodules = [name for name in _REQUIRES if _is_available(name)]
+    if not submodules:
+        return []
+
+    with ThreadPoolExecutor(max_workers=len(submodules)) as pool:
+        list(pool.map(lambda name: importlib.import_module(name, __name__), submodules))
+
+    for name, spec in _LAZY.items():
+        if spec[0] in submodules:
+            __getattr__(name)
+
+    return [name.lstrip(".") for name in submodules]
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
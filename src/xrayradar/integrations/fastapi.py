@@ -4,7 +4,7 @@ FastAPI integration for error tracking
 
 from typing import Any, Dict, Optional
 
-from ..client import ErrorTracker
+from ..client import ErrorTracker, _run_in_executor
 from ..models import Request as RequestModel
 
 try:
@@ -24,6 +24,8 @@ except ImportError:  # pragma: no cover
 class FastAPIIntegration:
     """FastAPI integration for automatic error tracking"""
 
+    __slots__ = ("fastapi_app", "client", "__weakref__")
+
     def __init__(self, fastapi_app: Optional[FastAPI] = None):
         """
         Initialize FastAPI integration
@@ -69,8 +71,9 @@ class FastAPIIntegration:
         # Extract request information
         request_data = await self._extract_request_data(request)
 
-        # Capture exception
-        self.client.capture_exception(
+        # Capture exception off the event loop
+        await _run_in_executor(
+            self.client.capture_exception,
             exc,
             request=request_data,
             tags={"framework": "fastapi"},
@@ -87,8 +90,9 @@ class FastAPIIntegration:
         # Extract request information
         request_data = await self._extract_request_data(request)
 
-        # Capture validation error
-        self.client.capture_exception(
+        # Capture validation error off the event loop
+        await _run_in_executor(
+            self.client.capture_exception,
             exc,
             request=request_data,
             tags={"framework": "fastapi", "error_type": "validation"},
@@ -105,8 +109,9 @@ class FastAPIIntegration:
         # Extract request information
         request_data = await self._extract_request_data(request)
 
-        # Capture HTTP exception
-        self.client.capture_message(
+        # Capture HTTP exception off the event loop
+        await _run_in_executor(
+            self.client.capture_message,
             f"HTTP {exc.status_code}: {exc.detail}",
             level="warning" if exc.status_code < 500 else "error",
             request=request_data,
@@ -20,6 +20,9 @@ except ImportError:  # pragma: no cover
 class FlaskIntegration:
     """Flask integration for automatic error tracking"""
 
+    # blinker keeps weak references to the connected bound methods
+    __slots__ = ("flask_app", "client", "__weakref__")
+
     def __init__(self, flask_app: Optional[Flask] = None, client: Optional[ErrorTracker] = None):
         """
         Initialize Flask integration
@@ -7,16 +7,58 @@ This integration can either:
   in the breadcrumb timeline when an error is later captured (console-style auto-capture).
 """
 
+import copy
+import functools
 import logging
-from typing import Optional, Set
+import logging.handlers
+import queue
+import random
+import re
+import sys
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Pattern, Set, Tuple, Union
 
 from ..client import ErrorTracker, get_client
 from ..models import Level
 
+# Records waiting for the listener thread in background mode; beyond this,
+# new records are dropped rather than blocking (or growing) the caller.
+_QUEUE_SIZE = 10000
+
+# Seconds teardown() waits for the client to deliver records drained from the queue
+_FLUSH_TIMEOUT = 5.0
+
+# The SDK's own loggers (and their children) are never captured: a failed
+# send logged there would otherwise become another event to send.
+_SDK_LOGGER = "xrayradar"
+
+# With fold_repeats, identical consecutive records are summarized at most this often (seconds)
+_REPEAT_WINDOW = 1.0
+
 
 class LoggingIntegration:
     """Integration with Python's logging module"""
 
+    __slots__ = (
+        "client",
+        "level",
+        "logger",
+        "exclude_loggers",
+        "capture_as_breadcrumbs",
+        "background",
+        "rate_limit",
+        "fold_repeats",
+        "sample_rate",
+        "_handler",
+        "_queue_handler",
+        "_listener",
+        "_config",
+        "_attached_to",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         client: Optional[ErrorTracker] = None,
@@ -24,6 +66,10 @@ class LoggingIntegration:
         logger: Optional[str] = None,
         exclude_loggers: Optional[Set[str]] = None,
         capture_as_breadcrumbs: bool = False,
+        background: bool = False,
+        rate_limit: Optional[float] = None,
+        fold_repeats: bool = False,
+        sample_rate: float = 1.0,
     ):
         """
         Initialize logging integration
@@ -31,17 +77,38 @@ class LoggingIntegration:
         Args:
             client: ErrorTracker client instance (optional, uses global client if not provided)
             level: Minimum log level to capture (default: logging.WARNING)
-            logger: Specific logger name prefix to capture (None = all loggers)
-            exclude_loggers: Set of logger names to exclude from capture
+            logger: Specific logger name prefix to capture; the handler is attached to that
+                logger instead of the root logger (None = all loggers)
+            exclude_loggers: Set of logger names to exclude from capture (child loggers are excluded too)
             capture_as_breadcrumbs: If True, add log records as breadcrumbs (type=console)
                 instead of sending them as events. Use for console-style auto-capture.
+            background: If True, log calls only enqueue the record and a QueueListener
+                thread runs the XrayRadar handler, so callers never wait on the transport.
+            rate_limit: Maximum records per second per (logger, level); extra records are
+                dropped before formatting. Must be positive; None disables it.
+            fold_repeats: If True, identical consecutive records are sent once, followed by
+                one summary record carrying a "repeated" count.
+            sample_rate: Fraction (0.0 to 1.0) of DEBUG and INFO records to keep; the rest are
+                dropped before formatting. WARNING and above are never sampled.
+
+        Raises:
+            ValueError: If rate_limit is zero or negative
         """
+        _check_rate_limit(rate_limit)
         self.client = client
         self.level = level
         self.logger = logger
         self.exclude_loggers = exclude_loggers or set()
         self.capture_as_breadcrumbs = capture_as_breadcrumbs
+        self.background = background
+        self.rate_limit = rate_limit
+        self.fold_repeats = fold_repeats
+        self.sample_rate = sample_rate
         self._handler: Optional[LoggingHandler] = None
+        self._queue_handler: Optional[_QueueHandler] = None
+        self._listener: Optional[_QueueListener] = None
+        self._config: Optional[Tuple[Any, ...]] = None
+        self._attached_to: logging.Logger = logging.root
 
     def setup(self, client: Optional[ErrorTracker] = None) -> None:
         """
@@ -50,27 +117,208 @@ class LoggingIntegration:
         Args:
             client: ErrorTracker client instance (optional)
         """
+        resolved = client or self.client or get_client() or ErrorTracker()
+        config = self._config_key(resolved)
         if self._handler is not None:
-            # Already setup, remove old handler first
-            logging.root.removeHandler(self._handler)
+            if config == self._config:
+                # Same configuration: keep the installed handler
+                return
+            # Already setup with different settings, remove old handler first
+            self.teardown()
 
-        self.client = client or self.client or get_client() or ErrorTracker()
+        self.client = resolved
+        self._config = config
         self._handler = LoggingHandler(
             client=self.client,
             level=self.level,
             logger=self.logger,
             exclude_loggers=self.exclude_loggers,
             capture_as_breadcrumbs=self.capture_as_breadcrumbs,
+            rate_limit=self.rate_limit,
+            fold_repeats=self.fold_repeats,
+            sample_rate=self.sample_rate,
+        )
+
+        # With a logger prefix, only that logger's subtree reaches the handler;
+        # records from unrelated loggers never get to its filters.
+        self._attached_to = (
+            logging.getLogger(self.logger.rstrip(".")) if self.logger else logging.root)
+
+        if not self.background:
+            self._attached_to.addHandler(self._handler)
+            return
+
+        records: "queue.Queue[logging.LogRecord]" = queue.Queue(_QUEUE_SIZE)
+        self._listener = _QueueListener(
+            records, self._handler, respect_handler_level=True)
+        # Same level as the real handler, so records below it are never enqueued.
+        self._queue_handler = _QueueHandler(records, self.client)
+        self._queue_handler.setLevel(self.level)
+        # Reject excluded loggers before the record is copied and enqueued
+        self._queue_handler.addFilter(self._handler._name_filter)
+        if self._handler._sample_filter is not None:
+            # Sample once, before enqueueing, rather than again on the listener thread
+            self._handler.removeFilter(self._handler._sample_filter)
+            self._queue_handler.addFilter(self._handler._sample_filter)
+        self._listener.start()
+        self._attached_to.addHandler(self._queue_handler)
+
+    def _config_key(self, client: ErrorTracker) -> Tuple[Any, ...]:
+        return (
+            id(client),
+            self.level,
+            self.logger,
+            frozenset(self.exclude_loggers),
+            self.capture_as_breadcrumbs,
+            self.background,
+            self.rate_limit,
+            self.fold_repeats,
+            self.sample_rate,
         )
-        logging.root.addHandler(self._handler)
 
     def teardown(self) -> None:
         """Remove the logging integration"""
+        self._config = None
+        if self._queue_handler is not None:
+            self._attached_to.removeHandler(self._queue_handler)
+            self._queue_handler = None
+        if self._listener is not None:
+            # Drains records that are already queued before returning.
+            self._listener.stop()
+            self._listener = None
+            if self._handler is not None:
+                # Sends held-back repeats before the client is flushed
+                self._handler.flush()
+            # The drained records may now sit in the client's transport (e.g. a
+            # BackgroundTransport batch); push them out as well.
+            if self.client is not None:
+                self.client.flush(_FLUSH_TIMEOUT)
         if self._handler is not None:
-            logging.root.removeHandler(self._handler)
+            self._attached_to.removeHandler(self._handler)
+            self._handler.close()
             self._handler = None
 
 
+class _QueueListener(logging.handlers.QueueListener):
+    """QueueListener whose stop marker waits for room in the bounded queue
+
+    The stock ``enqueue_sentinel`` uses ``put_nowait``, which raises
+    ``queue.Full`` when teardown happens during a log storm. The listener
+    thread is still draining at that point, so a blocking put always completes.
+    """
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps ``exc_info`` on the queued record
+
+    The stock ``prepare`` formats the record and drops ``exc_info``, which
+    would turn logged exceptions into plain messages. Only the message
+    arguments are merged here; formatting happens in LoggingHandler on the
+    listener thread.
+    """
+
+    def __init__(
+        self,
+        records: "queue.Queue[logging.LogRecord]",
+        client: Optional[ErrorTracker] = None,
+    ):
+        super().__init__(records)
+        self.client = client
+        self.dropped = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # A disabled client would discard the record on the listener thread;
+        # skip the copy and the enqueue instead.
+        if self.client is not None and not self.client._enabled:
+            return
+        super().emit(record)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # The listener is behind; drop instead of blocking the logging caller.
+            self.dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _check_rate_limit(rate_limit: Optional[float]) -> None:
+    if rate_limit is not None and rate_limit <= 0:
+        raise ValueError(
+            f"rate_limit must be a positive number of records per second, got {rate_limit}. "
+            f"Use None to disable rate limiting.")
+
+
+def _intern(name: Optional[str]) -> Optional[str]:
+    return sys.intern(name) if name is not None else None
+
+
+def _intern_names(names: Iterable[str]) -> FrozenSet[str]:
+    """Logger names are long-lived and compared often, so keep one copy of each"""
+    return frozenset(map(sys.intern, names))
+
+
+class _LoggerNameFilter(logging.Filter):
+    """Reject records from excluded loggers, the SDK's own loggers, or outside the configured logger prefix
+
+    Installed on LoggingHandler so that ``Handler.handle`` drops these records
+    before ``emit`` builds anything for them.
+    """
+
+    def __init__(self, logger: Optional[str] = None, exclude_loggers: Optional[Set[str]] = None):
+        super().__init__()
+        # Logger names repeat constantly, so the verdict is cached per name.
+        self._allowed = functools.lru_cache(maxsize=1024)(self._compute_allowed)
+        self.configure(logger, exclude_loggers)
+
+    def configure(self, logger: Optional[str] = None, exclude_loggers: Optional[Set[str]] = None) -> None:
+        """Replace the prefix and exclusions, discarding cached verdicts"""
+        self.prefix = _intern(logger)
+        self.excluded = _intern_names(exclude_loggers or ())
+        # One anchored pattern for all exclusions. Excluding a logger also
+        # excludes its children ("urllib3" covers "urllib3.connectionpool").
+        alternatives = "|".join(map(re.escape, sorted(self.excluded | {_SDK_LOGGER})))
+        self._excluded_re: Pattern[str] = re.compile(f"(?:{alternatives})(?:\\.|$)")
+        self._allowed.cache_clear()
+
+    def _compute_allowed(self, name: str) -> bool:
+        if self.prefix is not None and not name.startswith(self.prefix):
+            return False
+
+        if self._excluded_re.match(name):
+            return False
+
+        return True
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return self._allowed(record.name)
+
+
+class _SampleFilter(logging.Filter):
+    """Keep a random fraction of records below WARNING
+
+    Runs as a filter so dropped records are never formatted (or, in background
+    mode, copied and enqueued).
+    """
+
+    def __init__(self, sample_rate: float):
+        super().__init__()
+        self.sample_rate = sample_rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Sampling log volume is not a security decision, so the cheap
+        # Mersenne Twister is fine here (one call per DEBUG/INFO record).
+        return record.levelno >= logging.WARNING or random.random() < self.sample_rate  # nosec B311
+
+
 class LoggingHandler(logging.Handler):
     """Custom logging handler that sends log records to XrayRadar or adds them as breadcrumbs"""
 
@@ -83,6 +331,9 @@ class LoggingHandler(logging.Handler):
         logging.CRITICAL: Level.FATAL,
     }
 
+    # Shared by every handler created without exclusions
+    _EMPTY: FrozenSet[str] = frozenset()
+
     def __init__(
         self,
         client: ErrorTracker,
@@ -90,6 +341,9 @@ class LoggingHandler(logging.Handler):
         logger: Optional[str] = None,
         exclude_loggers: Optional[Set[str]] = None,
         capture_as_breadcrumbs: bool = False,
+        rate_limit: Optional[float] = None,
+        fold_repeats: bool = False,
+        sample_rate: float = 1.0,
     ):
         """
         Initialize logging handler
@@ -98,14 +352,165 @@ class LoggingHandler(logging.Handler):
             client: ErrorTracker client instance
             level: Minimum log level to capture
             logger: Specific logger name to capture (None = all loggers)
-            exclude_loggers: Set of logger names to exclude
+            exclude_loggers: Set of logger names to exclude (including their child loggers)
             capture_as_breadcrumbs: If True, add records as breadcrumbs (type=console) instead of events
+            rate_limit: Maximum records per second per (logger, level), with bursts of up to
+                twice that; extra records are dropped and counted. Must be positive;
+                None disables it.
+            fold_repeats: If True, records identical to the previous one (same logger, level,
+                message template and arguments) are held back and reported once as the last
+                such record with a "repeated" count, at most once per second.
+            sample_rate: Fraction (0.0 to 1.0) of records below WARNING to keep. Records
+                at WARNING and above, including errors, are never sampled.
+
+        Raises:
+            ValueError: If rate_limit is zero or negative
         """
+        _check_rate_limit(rate_limit)
         super().__init__(level=level)
         self.client = client
-        self.logger = logger
-        self.exclude_loggers = exclude_loggers or set()
+        self.logger = _intern(logger)
+        self.exclude_loggers = _intern_names(exclude_loggers) if exclude_loggers else self._EMPTY
         self.capture_as_breadcrumbs = capture_as_breadcrumbs
+        self.rate_limit = rate_limit
+        # (logger name, levelno) -> [tokens, last refill, records dropped since last pass]
+        self._buckets: Dict[Tuple[str, int], List[float]] = {}
+        self._buckets_lock = threading.Lock()
+        self.fold_repeats = fold_repeats
+        # Current run of identical records: key, start time, held-back count and last record
+        self._repeat_key: Optional[Tuple[Any, ...]] = None
+        self._repeat_started = 0.0
+        self._repeat_count = 0
+        self._repeat_record: Optional[logging.LogRecord] = None
+        # Sends the summary at the end of the window if no other record does first
+        self._repeat_timer: Optional[threading.Timer] = None
+        self._repeat_lock = threading.Lock()
+        self._name_filter = _LoggerNameFilter(logger, self.exclude_loggers)
+        self.addFilter(self._name_filter)
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
+        self._sample_filter: Optional[_SampleFilter] = None
+        if self.sample_rate < 1.0:
+            self._sample_filter = _SampleFilter(self.sample_rate)
+            self.addFilter(self._sample_filter)
+
+    def reconfigure(self, logger: Optional[str] = None, exclude_loggers: Optional[Set[str]] = None) -> None:
+        """
+        Change which loggers are captured
+
+        Args:
+            logger: Specific logger name to capture (None = all loggers)
+            exclude_loggers: Set of logger names to exclude (including their child loggers)
+        """
+        self.logger = _intern(logger)
+        self.exclude_loggers = _intern_names(exclude_loggers) if exclude_loggers else self._EMPTY
+        self._name_filter.configure(logger, self.exclude_loggers)
+
+    def _take_token(self, key: Tuple[str, int]) -> Optional[int]:
+        """
+        Token bucket for rate_limit
+
+        Returns None if the record should be dropped, otherwise how many records
+        with the same key were dropped since the last one that got through.
+        """
+        rate = self.rate_limit
+        now = time.monotonic()
+        with self._buckets_lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [2 * rate, now, 0]
+            bucket[0] = min(2 * rate, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            if bucket[0] < 1:
+                bucket[2] += 1
+                return None
+            bucket[0] -= 1
+            dropped = int(bucket[2])
+            bucket[2] = 0
+            return dropped
+
+    def _fold(self, record: logging.LogRecord) -> List[Tuple[logging.LogRecord, int]]:
+        """
+        Apply fold_repeats to a record
+
+        Returns the (record, repeated) pairs to send now: nothing while a
+        repeat is held back, otherwise any pending summary followed by the
+        record itself.
+        """
+        key: Optional[Tuple[Any, ...]] = (record.name, record.levelno, record.msg, record.args)
+        if record.exc_info:
+            key = None  # each exception has its own stack trace; never folded
+        else:
+            try:
+                hash(key)
+            except TypeError:
+                key = None  # unhashable arguments; never folded
+
+        now = time.monotonic()
+        with self._repeat_lock:
+            if key is not None and key == self._repeat_key:
+                if now - self._repeat_started < _REPEAT_WINDOW:
+                    self._repeat_count += 1
+                    self._repeat_record = record
+                    if self._repeat_timer is None:
+                        self._repeat_timer = threading.Timer(
+                            self._repeat_started + _REPEAT_WINDOW - now, self.flush)
+                        self._repeat_timer.daemon = True
+                        self._repeat_timer.start()
+                    return []
+                # Window is over: this record stands in for the held-back ones
+                repeated = self._repeat_count + 1
+                self._repeat_started = now
+                self._take_repeats()
+                return [(record, repeated)]
+
+            pending = self._take_repeats()
+            self._repeat_key = key
+            self._repeat_started = now
+            return pending + [(record, 1)]
+
+    def _take_repeats(self) -> List[Tuple[logging.LogRecord, int]]:
+        # Called with _repeat_lock held
+        if self._repeat_timer is not None:
+            self._repeat_timer.cancel()
+            self._repeat_timer = None
+        if self._repeat_record is None:
+            return []
+        pending = [(self._repeat_record, self._repeat_count)]
+        self._repeat_count = 0
+        self._repeat_record = None
+        return pending
+
+    def flush(self) -> None:
+        """Send the summary of any held-back repeated records"""
+        with self._repeat_lock:
+            pending = self._take_repeats()
+        for record, repeated in pending:
+            try:
+                self._send(record, repeated)
+            except Exception:
+                self.handleError(record)
+
+    def close(self) -> None:
+        """Flush held-back repeats and close the handler"""
+        self.flush()
+        super().close()
+
+    def handle(self, record: logging.LogRecord) -> Union[bool, logging.LogRecord]:
+        """
+        Filter and emit a record without taking the handler lock
+
+        The base implementation serializes ``emit`` behind a per-handler lock,
+        which exists to protect shared streams. This handler writes to no
+        stream, and the ErrorTracker calls it makes are thread-safe, so
+        concurrent logging threads don't need to queue up here.
+        """
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            # Python 3.12+: filters may return a replacement record
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
 
     def emit(self, record: logging.LogRecord) -> None:
         """
@@ -115,74 +520,107 @@ class LoggingHandler(logging.Handler):
             record: Log record to emit
         """
         try:
-            # Skip if logger is excluded
-            if record.name in self.exclude_loggers:
-                return
-
-            # Skip if specific logger is set and doesn't match
-            if self.logger is not None:
-                if not record.name.startswith(self.logger):
-                    return
+            # Logger name filtering is done by _LoggerNameFilter before emit is called.
 
             # Skip if client is not enabled
             if not self.client._enabled:
                 return
 
-            # Map Python logging level to XrayRadar level
-            xrayradar_level = self.LEVEL_MAP.get(record.levelno, Level.ERROR)
-            message = self.format(record)
-
-            if self.capture_as_breadcrumbs:
-                # Auto-capture as console breadcrumb (appears in timeline when error is captured)
-                self.client.add_breadcrumb(
-                    message=message,
-                    category=record.name,
-                    level=xrayradar_level,
-                    type="console",
-                    data={
-                        "logger": record.name,
-                        "module": record.module,
-                        "funcName": getattr(record, "funcName", None),
-                        "lineno": getattr(record, "lineno", None),
-                    },
-                )
+            if not self.fold_repeats:
+                self._send(record)
                 return
 
-            # Capture as message (not exception unless it's an exception log)
-            if record.exc_info:
-                exc_type, exc_value, exc_traceback = record.exc_info
-                if exc_value:
-                    self.client.capture_exception(
-                        exc_value,
-                        level=xrayradar_level,
-                        message=message,
-                        logger=record.name,
-                        module=record.module,
-                        funcName=record.funcName,
-                        lineno=record.lineno,
-                    )
-                else:
-                    self.client.capture_message(
-                        message,
-                        level=xrayradar_level,
-                        logger=record.name,
-                        module=record.module,
-                        funcName=record.funcName,
-                        lineno=record.lineno,
-                    )
-            else:
-                self.client.capture_message(
-                    message,
-                    level=xrayradar_level,
-                    logger=record.name,
-                    module=record.module,
-                    funcName=record.funcName,
-                    lineno=record.lineno,
-                )
+            for pending, repeated in self._fold(record):
+                self._send(pending, repeated)
 
         except Exception:
             self.handleError(record)
 
+    def _send(self, record: logging.LogRecord, repeated: int = 1) -> None:
+        """Rate-limit, then capture the record as a breadcrumb or event"""
+        dropped = 0
+        if self.rate_limit is not None:
+            taken = self._take_token((record.name, record.levelno))
+            if taken is None:
+                return
+            dropped = taken
+
+        # Counts of records that were dropped or folded into this one
+        extra: Dict[str, int] = {}
+        if dropped:
+            extra["dropped_records"] = dropped
+        if repeated > 1:
+            extra["repeated"] = repeated
+
+        # Map Python logging level to XrayRadar level
+        levelno = record.levelno
+        if 0 <= levelno < len(_LEVEL_BY_LEVELNO):
+            xrayradar_level = _LEVEL_BY_LEVELNO[levelno]
+        else:
+            xrayradar_level = Level.ERROR
+
+        if self.capture_as_breadcrumbs:
+            # Auto-capture as console breadcrumb (appears in timeline when error is captured)
+            data = _breadcrumb_data(
+                record.name, record.module, record.funcName, record.lineno)
+            if extra:
+                data = dict(data, **extra)
+            self.client.add_breadcrumb(
+                message=self.format(record),
+                category=record.name,
+                level=xrayradar_level,
+                type="console",
+                data=data,
+            )
+            return
+
+        # Capture as message (not exception unless it's an exception log)
+        exc_value = record.exc_info[1] if record.exc_info else None
+        if exc_value:
+            # The exception is captured with a structured stack trace, so
+            # skip format(), which would render the traceback as text too.
+            self.client.capture_exception(
+                exc_value,
+                level=xrayradar_level,
+                message=record.getMessage(),
+                logger=record.name,
+                module=record.module,
+                funcName=record.funcName,
+                lineno=record.lineno,
+                **extra,
+            )
+        else:
+            self.client.capture_message(
+                self.format(record),
+                level=xrayradar_level,
+                logger=record.name,
+                module=record.module,
+                funcName=record.funcName,
+                lineno=record.lineno,
+                **extra,
+            )
+
+
+# LoggingHandler.LEVEL_MAP as a table indexed by levelno; levels without an
+# entry (custom levels) map to ERROR, as with LEVEL_MAP.get(levelno, ERROR).
+_LEVEL_BY_LEVELNO = tuple(
+    LoggingHandler.LEVEL_MAP.get(levelno, Level.ERROR)
+    for levelno in range(max(LoggingHandler.LEVEL_MAP) + 1)
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _breadcrumb_data(
+    logger: str, module: str, func_name: Optional[str], lineno: int
+) -> Mapping[str, Any]:
+    """Shared read-only breadcrumb data for one log call site"""
+    return MappingProxyType({
+        "logger": logger,
+        "module": module,
+        "funcName": func_name,
+        "lineno": lineno,
+    })
+
 
 def setup_logging(
     client: Optional[ErrorTracker] = None,
@@ -190,6 +628,10 @@ def setup_logging(
     logger: Optional[str] = None,
     exclude_loggers: Optional[Set[str]] = None,
     capture_as_breadcrumbs: bool = False,
+    background: bool = False,
+    rate_limit: Optional[float] = None,
+    fold_repeats: bool = False,
+    sample_rate: float = 1.0,
 ) -> LoggingIntegration:
     """
     Setup logging integration
@@ -197,10 +639,20 @@ def setup_logging(
     Args:
         client: ErrorTracker client instance (optional)
         level: Minimum log level to capture (default: logging.WARNING)
-        logger: Specific logger name prefix to capture (None = all loggers)
-        exclude_loggers: Set of logger names to exclude from capture
+        logger: Specific logger name prefix to capture; the handler is attached to that
+            logger instead of the root logger (None = all loggers)
+        exclude_loggers: Set of logger names to exclude from capture (child loggers are excluded too)
         capture_as_breadcrumbs: If True, log records are added as breadcrumbs (type=console)
             instead of being sent as events. Use for console-style auto-capture in the timeline.
+        background: If True, records are handed to a QueueListener thread instead of being
+            processed on the logging caller's thread. Queued records are flushed on teardown().
+        rate_limit: Maximum records per second per (logger, level); extra records are dropped
+            and their count is attached to the next record that gets through. Must be positive;
+            None disables it.
+        fold_repeats: If True, identical consecutive records are sent once, followed by one
+            summary record with a "repeated" count (at most one per second while they continue).
+        sample_rate: Fraction (0.0 to 1.0) of DEBUG and INFO records to keep, e.g. 0.1 for
+            high-volume breadcrumbs. WARNING and above are never sampled.
 
     Returns:
         LoggingIntegration instance
@@ -219,6 +671,10 @@ def setup_logging(
         logger=logger,
         exclude_loggers=exclude_loggers,
         capture_as_breadcrumbs=capture_as_breadcrumbs,
+        background=background,
+        rate_limit=rate_limit,
+        fold_repeats=fold_repeats,
+        sample_rate=sample_rate,
     )
     integration.setup(client)
     return integration
@@ -5,20 +5,53 @@ Data models for error tracking events and contexts
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+import functools
+import os
+import sys
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from .version import get_sdk_info
 
-class Level(Enum):
-    """Error event severity levels"""
+# Objects created per frame / per breadcrumb use __slots__ where dataclasses
+# support it (Python 3.10+), which keeps them smaller than a per-instance dict.
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Maximum number of chained exceptions (__cause__ / __context__) reported
+# after the captured one.
+_MAX_EXCEPTION_CHAIN = 5
+
+
+def _new_event_id() -> str:
+    """
+    Return a random event ID in UUID4 text form
+
+    Equivalent to ``str(uuid.uuid4())`` (same format on the wire), but formats
+    the ``os.urandom`` bytes directly instead of building a UUID object.
+    """
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+class Level(str, Enum):
+    """Error event severity levels
+
+    Members are strings, so ``Level.WARNING == "warning"`` and plain level
+    strings are accepted wherever a Level is expected.
+    """
     FATAL = "fatal"
     ERROR = "error"
     WARNING = "warning"
     INFO = "info"
     DEBUG = "debug"
 
+    def __str__(self) -> str:
+        return self.value
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class StackFrame:
     """Represents a single stack frame"""
     filename: str
@@ -32,7 +65,7 @@ class StackFrame:
     in_app: bool = True
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ExceptionInfo:
     """Exception information"""
     type: str
@@ -74,14 +107,14 @@ class Context:
     environment: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Breadcrumb:
     """Breadcrumb for user activity tracking"""
     timestamp: datetime
     message: str
     category: Optional[str] = None
     level: Optional[Level] = None
-    data: Dict[str, Any] = field(default_factory=dict)
+    data: Mapping[str, Any] = field(default_factory=dict)
     type: Optional[str] = None
 
 
@@ -99,6 +132,9 @@ class Event:
     breadcrumbs: List[Breadcrumb] = field(default_factory=list)
     fingerprint: List[str] = field(default_factory=list)
     modules: Dict[str, str] = field(default_factory=dict)
+    # Exceptions chained to ``exception``, nearest first
+    exception_chain: List[ExceptionInfo] = field(default_factory=list)
+    exception_chain_truncated: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert event to dictionary for JSON serialization"""
@@ -137,7 +173,7 @@ class Event:
                     "message": crumb.message,
                     "category": crumb.category,
                     "level": crumb.level.value if crumb.level else None,
-                    "data": crumb.data,
+                    "data": dict(crumb.data),
                     "type": crumb.type,
                 } for crumb in self.breadcrumbs
             ],
@@ -147,27 +183,13 @@ class Event:
 
         if self.exception:
             result["exception"] = {
-                "values": [{
-                    "type": self.exception.type,
-                    "value": self.exception.value,
-                    "module": self.exception.module,
-                    "stacktrace": {
-                        "frames": [
-                            {
-                                "filename": frame.filename,
-                                "function": frame.function,
-                                "lineno": frame.lineno,
-                                "colno": frame.colno,
-                                "abs_path": frame.abs_path,
-                                "context_line": frame.context_line,
-                                "pre_context": frame.pre_context,
-                                "post_context": frame.post_context,
-                                "in_app": frame.in_app,
-                            } for frame in self.exception.stacktrace
-                        ]
-                    }
-                }]
+                "values": [
+                    _exception_info_to_dict(info)
+                    for info in [self.exception, *self.exception_chain]
+                ]
             }
+            if self.exception_chain_truncated:
+                result["exception"]["truncated"] = True
 
         return result
 
@@ -180,40 +202,142 @@ class Event:
         context: Optional[Context] = None,
     ) -> "Event":
         """Create an event from an exception"""
-        import uuid
-
-        exc_type = type(exc).__name__
-        exc_value = str(exc)
-        exc_module = exc.__class__.__module__
-
-        # Extract stack trace
-        stacktrace = []
-        tb = exc.__traceback__
-        while tb:
-            frame_info = _get_frame_info(tb.tb_frame)
-            if frame_info:
-                stacktrace.append(frame_info)
-            tb = tb.tb_next
-
-        stacktrace.reverse()  # Reverse to show call order
-
-        exception_info = ExceptionInfo(
-            type=exc_type,
-            value=exc_value,
-            stacktrace=stacktrace,
-            module=exc_module if exc_module != "builtins" else None,
-        )
+        exception_info = _get_exception_info(exc)
+        chain, truncated = _get_exception_chain(exc)
 
         return cls(
-            event_id=str(uuid.uuid4()),
+            event_id=_new_event_id(),
             timestamp=datetime.now(timezone.utc),
             level=level,
-            message=message or f"{exc_type}: {exc_value}",
+            message=message or f"{exception_info.type}: {exception_info.value}",
             exception=exception_info,
             contexts=context or Context(),
+            exception_chain=[_get_exception_info(e) for e in chain],
+            exception_chain_truncated=truncated,
         )
 
 
+def _exception_info_to_dict(info: ExceptionInfo) -> Dict[str, Any]:
+    return {
+        "type": info.type,
+        "value": info.value,
+        "module": info.module,
+        "stacktrace": {
+            "frames": [
+                {
+                    "filename": frame.filename,
+                    "function": frame.function,
+                    "lineno": frame.lineno,
+                    "colno": frame.colno,
+                    "abs_path": frame.abs_path,
+                    "context_line": frame.context_line,
+                    "pre_context": frame.pre_context,
+                    "post_context": frame.post_context,
+                    "in_app": frame.in_app,
+                } for frame in info.stacktrace
+            ]
+        }
+    }
+
+
+def _get_exception_info(exc: BaseException) -> ExceptionInfo:
+    """Build ExceptionInfo (type, value, module, stack trace) for one exception"""
+    exc_type = type(exc).__name__
+    exc_module = exc.__class__.__module__
+
+    # Extract stack trace
+    stacktrace = []
+    tb = exc.__traceback__
+    while tb:
+        frame_info = _get_frame_info(tb.tb_frame)
+        if frame_info:
+            stacktrace.append(frame_info)
+        tb = tb.tb_next
+
+    stacktrace.reverse()  # Reverse to show call order
+
+    return ExceptionInfo(
+        type=exc_type,
+        value=str(exc),
+        stacktrace=stacktrace,
+        module=exc_module if exc_module != "builtins" else None,
+    )
+
+
+def _get_exception_chain(
+    exc: BaseException, max_depth: int = _MAX_EXCEPTION_CHAIN
+) -> Tuple[List[BaseException], bool]:
+    """
+    Follow ``__cause__`` / ``__context__`` from ``exc``, nearest first
+
+    Walks iteratively and stops at ``max_depth`` exceptions or at a cycle.
+    Returns the chained exceptions and whether the chain was cut short.
+    """
+    chain: List[BaseException] = []
+    seen = {id(exc)}
+    current = exc
+    while True:
+        if current.__cause__ is not None:
+            nxt = current.__cause__
+        elif not current.__suppress_context__:
+            nxt = current.__context__
+        else:
+            nxt = None
+
+        if nxt is None or id(nxt) in seen:
+            return chain, False
+        if len(chain) >= max_depth:
+            return chain, True
+
+        seen.add(id(nxt))
+        chain.append(nxt)
+        current = nxt
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_source_context(
+    filename: str, lineno: int
+) -> Tuple[Optional[str], Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Read the source lines around ``lineno``
+
+    Cached per (filename, lineno) so repeated errors from the same code path
+    do not re-read the source file for every frame.
+    """
+    context_line = None
+    pre_context: List[str] = []
+    post_context: List[str] = []
+
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+
+        # Get context around the error line
+        # Tests expect:
+        # - pre_context: up to 5 lines before the error line
+        # - post_context: up to 2 lines after the error line
+        idx = lineno - 1
+
+        if lines:
+            # If idx is out of range, clamp for context extraction.
+            safe_idx = max(0, min(idx, len(lines) - 1))
+
+            pre_start = max(0, safe_idx - 5)
+            for line in lines[pre_start:safe_idx]:
+                pre_context.append(line.rstrip())
+
+            if 0 <= idx < len(lines):
+                context_line = lines[idx].rstrip()
+
+            for line in lines[safe_idx + 1:safe_idx + 3]:
+                post_context.append(line.rstrip())
+
+    except (IOError, OSError, UnicodeDecodeError, FileNotFoundError):
+        pass  # Source file not available or unreadable
+
+    return context_line, tuple(pre_context), tuple(post_context)
+
+
 def _get_frame_info(frame) -> Optional[StackFrame]:
     """Extract information from a frame object"""
     try:
@@ -233,36 +357,8 @@ def _get_frame_info(frame) -> Optional[StackFrame]:
         function = f_code.co_name
 
         # Try to get source context
-        context_line = None
-        pre_context = []
-        post_context = []
-
-        try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            # Get context around the error line
-            # Tests expect:
-            # - pre_context: up to 5 lines before the error line
-            # - post_context: up to 2 lines after the error line
-            idx = lineno - 1
-
-            if lines:
-                # If idx is out of range, clamp for context extraction.
-                safe_idx = max(0, min(idx, len(lines) - 1))
-
-                pre_start = max(0, safe_idx - 5)
-                for line in lines[pre_start:safe_idx]:
-                    pre_context.append(line.rstrip())
-
-                if 0 <= idx < len(lines):
-                    context_line = lines[idx].rstrip()
-
-                for line in lines[safe_idx + 1:safe_idx + 3]:
-                    post_context.append(line.rstrip())
-
-        except (IOError, OSError, UnicodeDecodeError, FileNotFoundError):
-            pass  # Source file not available or unreadable
+        context_line, pre_context, post_context = _get_source_context(
+            filename, lineno)
 
         # Determine if this is in-app code
         in_app = not any(
@@ -282,8 +378,8 @@ def _get_frame_info(frame) -> Optional[StackFrame]:
             lineno=lineno,
             abs_path=filename,
             context_line=context_line,
-            pre_context=pre_context,
-            post_context=post_context,
+            pre_context=list(pre_context),
+            post_context=list(post_context),
             in_app=in_app,
         )
 
@@ -4,17 +4,61 @@ Transport layer for sending events to the error tracking server
 
 import json
 import os
+import queue
+import sys
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, TextIO
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # pragma: no cover
 
 from .exceptions import TransportError, RateLimitedError, InvalidDsnError
 from .version import get_version
 
 
+def _encode_json(data: Dict[str, Any]) -> bytes:
+    """Encode event data as UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson is stricter than json (e.g. integers wider than 64 bits);
+            # let the stdlib encoder decide whether the data is really invalid.
+            pass
+    return json.dumps(data).encode("utf-8")
+
+
+def _post_retry() -> Retry:
+    """Retry policy for event POSTs: a couple of quick retries on gateway errors"""
+    options: Dict[str, Any] = {
+        "total": 2,
+        "backoff_factor": 0.1,
+        "status_forcelist": (502, 503, 504),
+        "raise_on_status": False,
+        # Sends may run on the application thread; a 503 with a long
+        # Retry-After must not park it (urllib3 would wait up to 6 hours).
+        "respect_retry_after_header": False,
+    }
+    try:
+        return Retry(allowed_methods=frozenset({"POST"}), **options)
+    except TypeError:
+        # urllib3 < 1.26 (still allowed by requests) calls it method_whitelist
+        return Retry(method_whitelist=frozenset({"POST"}), **options)
+
+
+# Seconds BackgroundTransport.close() waits for the worker to stop
+_CLOSE_TIMEOUT = 2.0
+
+
 class Transport(ABC):
     """Abstract base class for transport implementations"""
 
@@ -28,6 +72,24 @@ class Transport(ABC):
         """Flush any pending events"""
         pass  # pragma: no cover
 
+    def send_events(self, events: List[Dict[str, Any]]) -> Optional[int]:
+        """Send several events at once
+
+        Transports whose server accepts batched submissions can override this;
+        the default sends each event individually, so an event that fails is
+        dropped without losing the rest of the batch.
+
+        Returns:
+            Number of events that could not be sent
+        """
+        failed = 0
+        for event_data in events:
+            try:
+                self.send_event(event_data)
+            except Exception:
+                failed += 1
+        return failed
+
 
 class HttpTransport(Transport):
     """HTTP transport for sending events to a server"""
@@ -75,9 +137,18 @@ class HttpTransport(Transport):
         parsed = self._parse_dsn(dsn)
         self.project_id = parsed["project_id"]
         self.server_url = parsed["server_url"]
+        # Built once here rather than on every send
+        self.store_url = f"{self.server_url}/api/{self.project_id}/store/"
 
-        # Create session
+        # Create session (reused for every event so connections are kept alive)
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=_post_retry(),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             "Content-Type": "application/json",
             "User-Agent": f"xrayradar/{get_version()}",
@@ -137,16 +208,14 @@ class HttpTransport(Transport):
         """Send an event to the server"""
         try:
             # Check payload size
-            payload = json.dumps(event_data)
-            if len(payload.encode('utf-8')) > self.max_payload_size:
+            payload = _encode_json(event_data)
+            if len(payload) > self.max_payload_size:
                 # Truncate large payloads
                 event_data = self._truncate_payload(event_data)
-                payload = json.dumps(event_data)
-
-            url = f"{self.server_url}/api/{self.project_id}/store/"
+                payload = _encode_json(event_data)
 
             response = self.session.post(
-                url,
+                self.store_url,
                 data=payload,
                 timeout=self.timeout,
                 verify=self.verify_ssl,
@@ -220,14 +289,138 @@ class HttpTransport(Transport):
         # HTTP transport sends events immediately, so no flushing needed
         pass
 
+    def close(self) -> None:
+        """Close pooled connections"""
+        self.session.close()
+
+
+class BackgroundTransport(Transport):
+    """Transport wrapper that hands events to a background worker thread
+
+    ``send_event`` only enqueues the event, so callers never block on
+    serialization or network I/O. The worker drains up to ``max_batch``
+    queued events at a time and passes them to the wrapped transport.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        transport: Transport,
+        queue_size: int = 100,
+        max_batch: int = 64,
+    ):
+        """
+        Initialize background transport
+
+        Args:
+            transport: Transport used by the worker thread to send events
+            queue_size: Maximum number of pending events (extra events are dropped)
+            max_batch: Maximum number of events handed to the transport at once
+
+        Dropped and failed events are counted in ``dropped`` and ``failed``
+        rather than logged: with the logging integration installed, a log
+        record per failure would itself become an event to send.
+        """
+        self.transport = transport
+        self.max_batch = max(1, max_batch)
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self.dropped = 0
+        self.failed = 0
+
+    def send_event(self, event_data: Dict[str, Any]) -> None:
+        """Queue an event for the worker thread"""
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(event_data)
+        except queue.Full:
+            self.dropped += 1
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._worker, name="xrayradar.BackgroundTransport", daemon=True)
+                self._thread.start()
+
+    def _worker(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(item is self._STOP for item in batch)
+            events = [item for item in batch if item is not self._STOP]
+            try:
+                if events:
+                    self.failed += self.transport.send_events(events) or 0
+            except Exception:
+                self.failed += len(events)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if stop:
+                return
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait until all queued events have been handed to the transport"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                if deadline is None:
+                    self._queue.all_tasks_done.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._queue.all_tasks_done.wait(remaining)
+
+        self.transport.flush(timeout)
+
+    def close(self) -> None:
+        """Flush pending events, stop the worker and close the wrapped transport"""
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            try:
+                self._queue.put(self._STOP, timeout=_CLOSE_TIMEOUT)
+            except queue.Full:
+                # The worker is stuck on a slow transport; it is a daemon
+                # thread, so don't hold up shutdown waiting for it.
+                pass
+            else:
+                thread.join(_CLOSE_TIMEOUT)
+        self._thread = None
+
+        if hasattr(self.transport, "close"):
+            self.transport.close()
+
 
 class DebugTransport(Transport):
     """Debug transport that prints events to console"""
 
+    def __init__(self, stream: Optional[TextIO] = None):
+        """
+        Initialize debug transport
+
+        Args:
+            stream: Text stream to write events to (default: sys.stdout at send time)
+        """
+        self.stream = stream
+
     def send_event(self, event_data: Dict[str, Any]) -> None:
         """Print event to console for debugging"""
-        print(
-            f"[ErrorTracker] Event: {json.dumps(event_data, indent=2, default=str)}")
+        # A single write per event; no logging records or print() machinery.
+        stream = self.stream or sys.stdout
+        stream.write(
+            f"[ErrorTracker] Event: {json.dumps(event_data, indent=2, default=str)}\n")
 
     def flush(self, timeout: Optional[float] = None) -> None:
         """No-op for debug transport"""
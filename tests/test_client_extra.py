@@ -90,6 +90,14 @@ def test_add_breadcrumb_respects_max_breadcrumbs():
     assert t._breadcrumbs[1].message == "c"
 
 
+def test_add_breadcrumb_with_zero_max_breadcrumbs_keeps_none():
+    t = ErrorTracker(dsn="http://localhost/1",
+                     transport=DummyTransport(), max_breadcrumbs=0)
+
+    t.add_breadcrumb("a")
+    assert len(t._breadcrumbs) == 0
+
+
 def test_set_context_user_and_request_and_other():
     transport = DummyTransport()
     t = ErrorTracker(dsn="http://localhost/1", transport=transport)
@@ -113,6 +121,14 @@ def test_flush_calls_transport_flush():
     assert transport.flushed == [1.5]
 
 
+def test_close_flushes_with_bounded_timeout():
+    transport = DummyTransport()
+    t = ErrorTracker(dsn="http://localhost/1", transport=transport)
+
+    t.close()
+    assert transport.flushed == [2.0]
+
+
 def test_global_capture_exception_noop_when_no_client_and_no_current_exception(monkeypatch):
     xrayradar.reset_global()
     assert xrayradar.capture_exception() is None
@@ -301,6 +317,27 @@ def test_capture_message_returns_none_when_not_sampled(monkeypatch):
     assert transport.sent == []
 
 
+def test_should_sample_skips_rng_at_full_or_zero_rate(monkeypatch):
+    import xrayradar.client as client_mod
+
+    class FixedRandom:
+        calls = 0
+
+        def random(self):
+            FixedRandom.calls += 1
+            return 0.3
+
+    monkeypatch.setattr(client_mod, "_sample_random", FixedRandom())
+
+    assert ErrorTracker(sample_rate=1.0)._should_sample() is True
+    assert ErrorTracker(sample_rate=0.0)._should_sample() is False
+    assert FixedRandom.calls == 0
+
+    assert ErrorTracker(sample_rate=0.5)._should_sample() is True
+    assert ErrorTracker(sample_rate=0.25)._should_sample() is False
+    assert FixedRandom.calls == 2
+
+
 def test_capture_message_before_send_can_drop_event():
     transport = DummyTransport()
 
@@ -350,7 +387,7 @@ def test_disabled_client_methods_are_noops():
     t.set_extra("k", "v")
     t.set_context("user", {"id": "2"})
 
-    assert t._breadcrumbs == []
+    assert list(t._breadcrumbs) == []
     assert t._context.user is None
     assert t._context.tags == {}
     assert t._context.extra == {}
@@ -409,3 +446,95 @@ def test_global_helpers_delegate_to_client(monkeypatch):
     assert calls[1] == ("set_user", {"id": "1"})
     assert calls[2] == ("set_tag", "a", "b")
     assert calls[3] == ("set_extra", "k", "v")
+
+
+def test_background_option_wraps_transport():
+    from xrayradar.transport import BackgroundTransport
+
+    transport = DummyTransport()
+    t = ErrorTracker(dsn="http://localhost/1",
+                     transport=transport, background=True)
+    assert isinstance(t._transport, BackgroundTransport)
+
+    eid = t.capture_message("hello")
+    assert isinstance(eid, str)
+    t.close()
+    assert len(transport.sent) == 1
+    assert transport.sent[0]["message"] == "hello"
+
+
+def test_acapture_exception_and_message_run_off_loop():
+    import asyncio
+
+    transport = DummyTransport()
+    t = ErrorTracker(dsn="http://localhost/1", transport=transport)
+
+    async def run():
+        eid = await t.acapture_exception(ValueError("boom"), foo="bar")
+        mid = await t.acapture_message("hello")
+        return eid, mid
+
+    eid, mid = asyncio.run(run())
+    assert isinstance(eid, str) and isinstance(mid, str)
+    assert transport.sent[0]["contexts"]["extra"]["foo"] == "bar"
+    assert transport.sent[1]["message"] == "hello"
+
+
+def test_acapture_exception_uses_current_exception():
+    import asyncio
+
+    transport = DummyTransport()
+    t = ErrorTracker(dsn="http://localhost/1", transport=transport)
+
+    async def run():
+        try:
+            raise RuntimeError("current")
+        except RuntimeError:
+            return await t.acapture_exception()
+
+    assert isinstance(asyncio.run(run()), str)
+    assert "current" in transport.sent[0]["message"]
+
+    with pytest.raises(ValueError):
+        asyncio.run(t.acapture_exception())
+
+
+def test_capture_and_breadcrumb_accept_string_levels():
+    transport = DummyTransport()
+    t = ErrorTracker(dsn="http://localhost/1", transport=transport)
+
+    t.add_breadcrumb("crumb", level="info")
+    assert t.capture_message("hello", level="warning") is not None
+    assert t.capture_exception(ValueError("boom"), level="fatal") is not None
+
+    assert transport.sent[0]["level"] == "warning"
+    assert transport.sent[0]["breadcrumbs"][0]["level"] == "info"
+    assert transport.sent[1]["level"] == "fatal"
+
+
+def test_breadcrumb_rate_limit_drops_and_reports(monkeypatch):
+    import xrayradar.client as client_mod
+
+    now = {"t": 1000.0}
+    monkeypatch.setattr(client_mod.time, "monotonic", lambda: now["t"])
+
+    transport = DummyTransport()
+    t = ErrorTracker(dsn="http://localhost/1", transport=transport,
+                     breadcrumb_rate_limit=2)
+
+    # Burst allows twice the rate, the rest is dropped.
+    for i in range(6):
+        t.add_breadcrumb(f"b{i}")
+    assert [b.message for b in t._breadcrumbs] == ["b0", "b1", "b2", "b3"]
+
+    # Tokens refill over time.
+    now["t"] += 0.5
+    t.add_breadcrumb("later")
+    assert t._breadcrumbs[-1].message == "later"
+
+    t.capture_message("hello")
+    assert transport.sent[0]["contexts"]["tags"]["dropped_breadcrumbs"] == "2"
+    assert "dropped_breadcrumbs" not in t._context.tags
+
+    t.capture_message("again")
+    assert "dropped_breadcrumbs" not in transport.sent[1]["contexts"]["tags"]
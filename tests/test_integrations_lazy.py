@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import xrayradar
+import xrayradar.integrations as integrations
+
+
+def test_lazy_attribute_resolves_and_is_cached():
+    from xrayradar.integrations.logging import LoggingIntegration
+
+    assert integrations.LoggingIntegration is LoggingIntegration
+    assert integrations.__dict__["LoggingIntegration"] is LoggingIntegration
+
+
+def test_unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        integrations.NotAnIntegration
+
+
+def test_dir_lists_lazy_names():
+    names = dir(integrations)
+    for name in integrations.__all__:
+        assert name in names
+
+
+def test_import_does_not_load_framework_submodules():
+    src_dir = os.path.dirname(os.path.dirname(xrayradar.__file__))
+    env = dict(os.environ, PYTHONPATH=src_dir)
+    code = (
+        "import sys, xrayradar.integrations\n"
+        "loaded = [m for m in ('flask', 'django', 'fastapi', 'graphene', 'drf')\n"
+        "          if 'xrayradar.integrations.' + m in sys.modules]\n"
+        "print(','.join(loaded))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout.strip() == ""
+
+
+def test_preload_integrations_skips_missing_frameworks(monkeypatch):
+    monkeypatch.setattr(integrations.importlib.util, "find_spec", lambda name: None)
+
+    assert integrations.preload_integrations() == ["logging"]
+    assert "LoggingIntegration" in integrations.__dict__
+
+
+def test_preload_integrations_loads_available_frameworks(monkeypatch):
+    # Pretend DRF's dependency is installed; the submodule itself tolerates its absence.
+    monkeypatch.setitem(integrations._REQUIRES, ".drf", "json")
+
+    loaded = integrations.preload_integrations()
+
+    assert "drf" in loaded
+    assert "xrayradar.integrations.drf" in sys.modules
+    assert "make_drf_exception_handler" in integrations.__dict__
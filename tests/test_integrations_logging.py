@@ -148,7 +148,7 @@ class TestLoggingIntegration:
             _client = original_client
 
     def test_setup_replaces_existing_handler(self):
-        """Test setup replaces existing handler"""
+        """Test setup replaces existing handler when the configuration changed"""
         client = ErrorTracker(dsn="https://xrayradar.com/test")
         integration = LoggingIntegration()
         
@@ -162,7 +162,8 @@ class TestLoggingIntegration:
             integration.setup(client)
             first_handler = integration._handler
             
-            # Setup again
+            # Setup again with a different level
+            integration.level = logging.ERROR
             integration.setup(client)
             second_handler = integration._handler
             
@@ -176,6 +177,51 @@ class TestLoggingIntegration:
             if integration._handler:
                 logging.root.removeHandler(integration._handler)
 
+    def test_setup_is_idempotent_for_same_configuration(self):
+        """Test calling setup again with unchanged settings keeps the installed handler"""
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        integration = LoggingIntegration()
+
+        try:
+            integration.setup(client)
+            first_handler = integration._handler
+            integration.setup(client)
+            integration.setup()
+
+            assert integration._handler is first_handler
+            assert logging.root.handlers.count(first_handler) == 1
+
+            # Changed settings are a different configuration
+            integration.exclude_loggers = {"urllib3"}
+            integration.setup()
+            assert integration._handler is not first_handler
+            assert first_handler not in logging.root.handlers
+        finally:
+            integration.teardown()
+
+    def test_setup_with_logger_attaches_to_that_logger(self):
+        """Test a logger prefix attaches the handler to that logger instead of root"""
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        integration = LoggingIntegration(logger="myapp")
+
+        try:
+            integration.setup(client)
+            app_logger = logging.getLogger("myapp")
+
+            assert integration._handler in app_logger.handlers
+            assert integration._handler not in logging.root.handlers
+
+            with patch.object(client, "capture_message") as mock_capture:
+                logging.getLogger("myapp.db").error("in subtree")
+                logging.getLogger("sqlalchemy").error("elsewhere")
+
+            mock_capture.assert_called_once()
+            assert mock_capture.call_args[0][0] == "in subtree"
+        finally:
+            integration.teardown()
+
+        assert all(not isinstance(h, LoggingHandler) for h in logging.getLogger("myapp").handlers)
+
     def test_teardown_removes_handler(self):
         """Test teardown removes handler"""
         client = ErrorTracker(dsn="https://xrayradar.com/test")
@@ -200,6 +246,14 @@ class TestLoggingIntegration:
             if integration._handler:
                 logging.root.removeHandler(integration._handler)
 
+    def test_integration_has_no_instance_dict(self):
+        """Test the integration declares __slots__ but stays weak-referenceable"""
+        import weakref
+
+        integration = LoggingIntegration()
+        assert not hasattr(integration, "__dict__")
+        assert weakref.ref(integration)() is integration
+
     def test_teardown_without_handler(self):
         """Test teardown when no handler is set"""
         integration = LoggingIntegration()
@@ -231,6 +285,42 @@ class TestLoggingHandler:
         handler = LoggingHandler(client=client, exclude_loggers=None)
         assert handler.exclude_loggers == set()
 
+    def test_exclude_loggers_stored_as_frozenset(self):
+        """Test exclusions are frozen copies and handlers without them share one empty set"""
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        excluded = {"urllib3"}
+        handler = LoggingHandler(client=client, exclude_loggers=excluded)
+        excluded.add("requests")
+
+        assert handler.exclude_loggers == frozenset({"urllib3"})
+        assert LoggingHandler(client=client).exclude_loggers is LoggingHandler(client=client).exclude_loggers
+
+    def test_handlers_share_the_default_formatter(self):
+        """Test handlers do not allocate their own Formatter"""
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        handler = LoggingHandler(client=client)
+        other = LoggingHandler(client=client)
+
+        assert handler.formatter is None and other.formatter is None
+        record = logging.LogRecord("app", logging.ERROR, "test.py", 1, "a %s", ("b",), None)
+        with patch.object(logging, "_defaultFormatter", wraps=logging._defaultFormatter) as fmt:
+            assert handler.format(record) == other.format(record) == "a b"
+        assert fmt.format.call_count == 2
+
+    def test_logger_names_are_interned(self):
+        """Test configured logger names are stored as interned strings"""
+        import sys
+
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        # Built at runtime so they are distinct objects from any literal
+        prefix = "".join(["my", "app"])
+        excluded = "".join(["url", "lib3"])
+        handler = LoggingHandler(client=client, logger=prefix, exclude_loggers={excluded})
+
+        assert handler.logger is sys.intern("myapp")
+        assert next(iter(handler.exclude_loggers)) is sys.intern("urllib3")
+        assert handler._name_filter.prefix is sys.intern("myapp")
+
     def test_level_map(self):
         """Test level mapping"""
         assert LoggingHandler.LEVEL_MAP[logging.DEBUG] == Level.DEBUG
@@ -257,9 +347,103 @@ class TestLoggingHandler:
             exc_info=None,
         )
         
-        handler.emit(record)
-        # Should not call capture_message or capture_exception
-        # We can't easily verify this without mocking, but the code path is covered
+        with patch.object(client, 'capture_message') as mock_capture:
+            handler.handle(record)
+            mock_capture.assert_not_called()
+
+    def test_emit_skips_child_of_excluded_logger(self):
+        """Test excluding a logger also excludes its child loggers"""
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        handler = LoggingHandler(
+            client=client,
+            exclude_loggers={"urllib3"},
+        )
+
+        with patch.object(client, 'capture_message') as mock_capture:
+            for name in ("urllib3.connectionpool", "urllib3x"):
+                record = logging.LogRecord(
+                    name=name,
+                    level=logging.ERROR,
+                    pathname="test.py",
+                    lineno=1,
+                    msg="Test message",
+                    args=(),
+                    exc_info=None,
+                )
+                handler.handle(record)
+
+            # Only the unrelated "urllib3x" logger gets through
+            mock_capture.assert_called_once()
+
+    def test_excluded_logger_names_are_matched_literally(self):
+        """Test dots in excluded names are not treated as regex wildcards"""
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        handler = LoggingHandler(client=client, exclude_loggers={"app.db", "requests"})
+
+        def passes(name):
+            return bool(handler.filter(logging.LogRecord(
+                name, logging.ERROR, "test.py", 1, "msg", (), None)))
+
+        assert not passes("app.db")
+        assert not passes("app.db.pool")
+        assert not passes("requests")
+        assert passes("appXdb")
+        assert passes("app")
+        assert passes("app.dbx")
+
+    def test_logger_name_verdict_is_cached_until_reconfigure(self):
+        """Test the per-name filter result is cached and reset by reconfigure()"""
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        handler = LoggingHandler(client=client, exclude_loggers={"noisy"})
+
+        def record(name):
+            return logging.LogRecord(name, logging.ERROR, "test.py", 1, "msg", (), None)
+
+        assert not handler.filter(record("noisy.child"))
+        assert handler.filter(record("app"))
+        assert handler.filter(record("app"))
+        info = handler._name_filter._allowed.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+
+        handler.reconfigure(logger="app", exclude_loggers={"app.db"})
+
+        assert handler._name_filter._allowed.cache_info().currsize == 0
+        assert handler.exclude_loggers == {"app.db"}
+        assert handler.filter(record("noisy.child")) is False  # outside the prefix now
+        assert handler.filter(record("app.web"))
+        assert not handler.filter(record("app.db.pool"))
+
+    def test_handle_does_not_take_handler_lock(self):
+        """Test handle() filters and emits without acquiring the handler lock"""
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        handler = LoggingHandler(client=client, exclude_loggers={"noisy"})
+
+        with patch.object(handler, "acquire", side_effect=AssertionError("locked")), \
+                patch.object(client, "capture_message") as mock_capture:
+            assert handler.handle(logging.LogRecord(
+                "app", logging.ERROR, "test.py", 1, "kept", (), None))
+            assert not handler.handle(logging.LogRecord(
+                "noisy", logging.ERROR, "test.py", 1, "dropped", (), None))
+
+        mock_capture.assert_called_once()
+        assert mock_capture.call_args[0][0] == "kept"
+
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason="filters return records on 3.12+")
+    def test_handle_emits_record_returned_by_filter(self):
+        """Test a filter returning a replacement record is honoured"""
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        handler = LoggingHandler(client=client)
+
+        def redact(record):
+            replacement = logging.makeLogRecord(record.__dict__)
+            replacement.msg = "redacted"
+            return replacement
+
+        handler.addFilter(redact)
+        with patch.object(client, "capture_message") as mock_capture:
+            handler.handle(logging.LogRecord("app", logging.ERROR, "test.py", 1, "secret", (), None))
+
+        assert mock_capture.call_args[0][0] == "redacted"
 
     def test_emit_skips_when_logger_prefix_not_matching(self):
         """Test emit skips when logger prefix doesn't match"""
@@ -279,8 +463,10 @@ class TestLoggingHandler:
             exc_info=None,
         )
         
-        handler.emit(record)
-        # Should skip because "other_app" doesn't start with "myapp"
+        with patch.object(client, 'capture_message') as mock_capture:
+            handler.handle(record)
+            # Should skip because "other_app" doesn't start with "myapp"
+            mock_capture.assert_not_called()
 
     def test_emit_skips_when_client_disabled(self):
         """Test emit skips when client is disabled"""
@@ -361,6 +547,237 @@ class TestLoggingHandler:
             assert call_kw["data"]["funcName"] == "handle_request"
             assert call_kw["data"]["lineno"] == 10
 
+    def test_before_send_can_scrub_logging_breadcrumb_data(self):
+        """Test before_send gets mutable breadcrumb data even though it is shared per call site"""
+        transport = Mock()
+
+        def scrub(event):
+            for crumb in event.breadcrumbs:
+                crumb.data["funcName"] = "[scrubbed]"
+            return event
+
+        client = ErrorTracker(transport=transport, before_send=scrub)
+        handler = LoggingHandler(client=client, level=logging.INFO, capture_as_breadcrumbs=True)
+        record = logging.LogRecord("app", logging.INFO, "app.py", 7, "tick", (), None)
+        record.funcName = "login"
+        handler.emit(record)
+
+        assert client.capture_message("done") is not None
+        event_data = transport.send_event.call_args[0][0]
+        assert event_data["breadcrumbs"][0]["data"]["funcName"] == "[scrubbed]"
+        # The buffered breadcrumb keeps the shared read-only mapping
+        assert client._breadcrumbs[0].data["funcName"] == "login"
+
+    def test_breadcrumb_data_is_shared_per_call_site(self):
+        """Test repeated log lines reuse one read-only data mapping that still serializes"""
+        import json
+
+        transport = Mock()
+        client = ErrorTracker(transport=transport)
+        handler = LoggingHandler(client=client, level=logging.INFO, capture_as_breadcrumbs=True)
+
+        for _ in range(2):
+            record = logging.LogRecord("app", logging.INFO, "app.py", 7, "tick", (), None)
+            record.funcName = "loop"
+            handler.emit(record)
+
+        first, second = client._breadcrumbs
+        assert first.data is second.data
+        with pytest.raises(TypeError):
+            first.data["lineno"] = 8
+
+        client.capture_message("done")
+        event_data = transport.send_event.call_args[0][0]
+        crumb = json.loads(json.dumps(event_data))["breadcrumbs"][0]
+        assert crumb["data"] == {"logger": "app", "module": "app", "funcName": "loop", "lineno": 7}
+
+    def test_breadcrumb_mode_keeps_only_newest_records(self):
+        """Test sustained logging in breadcrumb mode stays within max_breadcrumbs"""
+        from collections import deque
+
+        client = ErrorTracker(dsn="https://xrayradar.com/test", max_breadcrumbs=3)
+        handler = LoggingHandler(client=client, level=logging.INFO, capture_as_breadcrumbs=True)
+
+        for i in range(1000):
+            handler.emit(logging.LogRecord("app", logging.INFO, "app.py", 1, "line %d", (i,), None))
+
+        assert isinstance(client._breadcrumbs, deque)
+        assert [crumb.message for crumb in client._breadcrumbs] == ["line 997", "line 998", "line 999"]
+
+    def test_rate_limit_drops_records_per_logger_and_level(self, monkeypatch):
+        """Test the per-(logger, level) token bucket and the dropped-record count"""
+        import xrayradar.integrations.logging as logging_mod
+
+        now = [100.0]
+        monkeypatch.setattr(logging_mod.time, "monotonic", lambda: now[0])
+
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        handler = LoggingHandler(client=client, rate_limit=1.0)
+
+        def record(name, levelno=logging.ERROR):
+            return logging.LogRecord(name, levelno, "test.py", 1, "msg", (), None)
+
+        with patch.object(client, "capture_message") as mock_capture:
+            for _ in range(5):
+                handler.emit(record("storm"))
+            # Burst of two, then dropped; other keys have their own bucket
+            assert mock_capture.call_count == 2
+            handler.emit(record("storm", logging.WARNING))
+            handler.emit(record("other"))
+            assert mock_capture.call_count == 4
+
+            now[0] += 1.0
+            handler.emit(record("storm"))
+
+        assert mock_capture.call_count == 5
+        assert mock_capture.call_args[1]["dropped_records"] == 3
+        assert "dropped_records" not in mock_capture.call_args_list[0][1]
+
+    def test_sample_rate_drops_only_records_below_warning(self, monkeypatch):
+        """Test sample_rate keeps a fraction of DEBUG/INFO and never samples WARNING and up"""
+        import xrayradar.integrations.logging as logging_mod
+
+        rolls = iter([0.2, 0.7])
+        monkeypatch.setattr(logging_mod.random, "random", lambda: next(rolls))
+
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        handler = LoggingHandler(client=client, level=logging.DEBUG, sample_rate=0.5)
+
+        def record(levelno):
+            return logging.LogRecord("app", levelno, "test.py", 1, "msg", (), None)
+
+        with patch.object(client, "capture_message") as mock_capture, \
+                patch.object(handler, "format", wraps=handler.format) as mock_format:
+            handler.handle(record(logging.INFO))  # 0.2 < 0.5: kept
+            handler.handle(record(logging.INFO))  # 0.7: dropped
+            handler.handle(record(logging.ERROR))  # no roll left; must not sample
+            assert mock_capture.call_count == 2
+            assert mock_format.call_count == 2
+
+        assert LoggingHandler(client=client)._sample_filter is None
+
+    @pytest.mark.parametrize("rate_limit", [0, -1.0])
+    def test_rate_limit_must_be_positive(self, rate_limit):
+        """Test a zero or negative rate_limit is rejected instead of dropping everything"""
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+
+        with pytest.raises(ValueError, match="rate_limit"):
+            LoggingHandler(client=client, rate_limit=rate_limit)
+        with pytest.raises(ValueError, match="rate_limit"):
+            LoggingIntegration(client=client, rate_limit=rate_limit)
+
+    def test_fold_repeats_sends_one_summary_for_identical_records(self, monkeypatch):
+        """Test identical consecutive records are folded into a 'repeated' summary"""
+        import xrayradar.integrations.logging as logging_mod
+
+        now = [100.0]
+        monkeypatch.setattr(logging_mod.time, "monotonic", lambda: now[0])
+
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        handler = LoggingHandler(client=client, fold_repeats=True)
+
+        def record(msg, *args):
+            return logging.LogRecord("app", logging.ERROR, "test.py", 1, msg, args, None)
+
+        with patch.object(client, "capture_message") as mock_capture:
+            for _ in range(4):
+                handler.emit(record("retry %d", 1))
+            assert mock_capture.call_count == 1
+            assert "repeated" not in mock_capture.call_args[1]
+
+            # A different record first reports the three held-back repeats
+            handler.emit(record("retry %d", 2))
+            calls = mock_capture.call_args_list
+            assert [c[0][0] for c in calls] == ["retry 1", "retry 1", "retry 2"]
+            assert calls[1][1]["repeated"] == 3
+            assert "repeated" not in calls[2][1]
+
+            # Once the window has passed a repeat goes out with the running count
+            handler.emit(record("retry %d", 2))
+            handler.emit(record("retry %d", 2))
+            now[0] += 1.5
+            handler.emit(record("retry %d", 2))
+            assert mock_capture.call_count == 4
+            assert mock_capture.call_args[1]["repeated"] == 3
+
+            # Held-back repeats are sent on flush()/close()
+            handler.emit(record("retry %d", 2))
+            handler.close()
+            assert mock_capture.call_count == 5
+            # A single held-back record is sent as a plain record
+            assert "repeated" not in mock_capture.call_args[1]
+
+    def test_fold_repeats_timer_sends_summary_after_burst(self, monkeypatch):
+        """Test a burst followed by silence is summarized when the window ends"""
+        import xrayradar.integrations.logging as logging_mod
+
+        now = [100.0]
+        monkeypatch.setattr(logging_mod.time, "monotonic", lambda: now[0])
+        timers = []
+
+        class FakeTimer:
+            def __init__(self, interval, function):
+                self.interval = interval
+                self.function = function
+                self.cancelled = False
+                timers.append(self)
+
+            def start(self):
+                pass
+
+            def cancel(self):
+                self.cancelled = True
+
+        monkeypatch.setattr(logging_mod.threading, "Timer", FakeTimer)
+
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        handler = LoggingHandler(client=client, fold_repeats=True)
+
+        with patch.object(client, "capture_message") as mock_capture:
+            handler.emit(logging.LogRecord("app", logging.ERROR, "test.py", 1, "down", (), None))
+            now[0] += 0.25
+            for _ in range(3):
+                handler.emit(logging.LogRecord("app", logging.ERROR, "test.py", 1, "down", (), None))
+
+            # One timer for the run, due when the window that started the run ends
+            assert len(timers) == 1
+            assert timers[0].interval == pytest.approx(0.75)
+            assert mock_capture.call_count == 1
+
+            timers[0].function()
+
+        assert mock_capture.call_count == 2
+        assert mock_capture.call_args[1]["repeated"] == 3
+        assert timers[0].cancelled
+        assert handler._repeat_timer is None
+
+    def test_fold_repeats_never_folds_exception_records(self):
+        """Test logger.exception() calls for different exceptions are each captured"""
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        handler = LoggingHandler(client=client, fold_repeats=True)
+
+        errors = [ValueError("a"), KeyError("b"), ValueError("c")]
+        with patch.object(client, "capture_exception") as mock_capture:
+            for exc in errors:
+                handler.emit(logging.LogRecord(
+                    "app", logging.ERROR, "test.py", 1, "failed", (), (type(exc), exc, None)))
+
+        assert [c[0][0] for c in mock_capture.call_args_list] == errors
+        assert handler._repeat_timer is None
+
+    def test_fold_repeats_ignores_unhashable_args(self):
+        """Test records with unhashable arguments are never folded"""
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        handler = LoggingHandler(client=client, fold_repeats=True)
+
+        with patch.object(client, "capture_message") as mock_capture:
+            for _ in range(3):
+                record = logging.LogRecord(
+                    "app", logging.ERROR, "test.py", 1, "payload %s", ([1, 2],), None)
+                handler.emit(record)
+
+        assert mock_capture.call_count == 3
+
     def test_emit_captures_exception_with_exc_value(self):
         """Test emit captures exception when exc_info has exception value"""
         client = ErrorTracker(dsn="https://xrayradar.com/test")
@@ -392,6 +809,35 @@ class TestLoggingHandler:
             assert "Exception occurred" in call_args[1]["message"]
             assert call_args[1]["logger"] == "test"
 
+    def test_emit_exception_does_not_format_traceback(self):
+        """Test exception records skip format() and send just the log message"""
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        handler = LoggingHandler(client=client)
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord(
+                "test", logging.ERROR, "test.py", 1, "failed %s", ("job",), sys.exc_info())
+
+        with patch.object(handler, "format") as mock_format, \
+                patch.object(client, "capture_exception") as mock_capture:
+            handler.emit(record)
+
+        mock_format.assert_not_called()
+        assert mock_capture.call_args[1]["message"] == "failed job"
+
+    def test_emit_does_not_format_when_client_disabled(self):
+        """Test disabled clients return before any formatting"""
+        client = ErrorTracker()
+        handler = LoggingHandler(client=client)
+        record = logging.LogRecord("test", logging.ERROR, "test.py", 1, "msg", (), None)
+
+        with patch.object(handler, "format") as mock_format:
+            handler.emit(record)
+
+        mock_format.assert_not_called()
+
     def test_emit_captures_message_when_exc_info_has_no_value(self):
         """Test emit captures message when exc_info exists but has no value"""
         client = ErrorTracker(dsn="https://xrayradar.com/test")
@@ -462,6 +908,18 @@ class TestLoggingHandler:
             call_args = mock_capture.call_args
             assert call_args[1]["level"] == Level.ERROR
 
+    def test_emit_level_table_matches_level_map(self):
+        """Test every levelno maps like LEVEL_MAP.get(levelno, Level.ERROR)"""
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        handler = LoggingHandler(client=client, level=logging.NOTSET)
+
+        with patch.object(client, 'capture_message') as mock_capture:
+            for levelno in (-5, 0, 5, 10, 20, 25, 30, 40, 50, 51):
+                record = logging.LogRecord("test", levelno, "test.py", 1, "msg", (), None)
+                handler.emit(record)
+                expected = LoggingHandler.LEVEL_MAP.get(levelno, Level.ERROR)
+                assert mock_capture.call_args[1]["level"] == expected
+
     def test_emit_with_logger_prefix_matching(self):
         """Test emit processes when logger prefix matches"""
         client = ErrorTracker(dsn="https://xrayradar.com/test")
@@ -542,8 +1000,7 @@ class TestSetupLogging:
             assert integration.exclude_loggers == {"test"}
             assert integration._handler is not None
         finally:
-            if integration._handler:
-                logging.root.removeHandler(integration._handler)
+            integration.teardown()
 
     def test_setup_logging_with_defaults(self):
         """Test setup_logging with default parameters"""
@@ -581,3 +1038,229 @@ class TestSetupLogging:
         finally:
             if integration._handler:
                 logging.root.removeHandler(integration._handler)
+
+    def test_setup_logging_background_uses_queue_listener(self):
+        """Test background mode enqueues records and delivers them on the listener thread"""
+        import threading
+
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        integration = setup_logging(client=client, level=logging.ERROR, background=True)
+
+        try:
+            assert integration._queue_handler in logging.root.handlers
+            assert integration._handler not in logging.root.handlers
+            assert integration._queue_handler.level == logging.ERROR
+
+            threads = []
+            with patch.object(client, "capture_exception",
+                              side_effect=lambda *a, **k: threads.append(threading.current_thread())) as mock_capture:
+                try:
+                    raise ValueError("boom")
+                except ValueError:
+                    logging.getLogger("bg").exception("failed %s", "job")
+                logging.getLogger("bg").warning("below level")
+                # stop() drains the queue before returning
+                integration.teardown()
+
+            mock_capture.assert_called_once()
+            assert isinstance(mock_capture.call_args[0][0], ValueError)
+            assert "failed job" in mock_capture.call_args[1]["message"]
+            assert threads[0] is not threading.current_thread()
+        finally:
+            integration.teardown()
+
+        assert integration._listener is None
+        assert integration._queue_handler is None
+        assert integration._handler is None
+
+    def test_background_queue_drops_records_when_full(self):
+        """Test a full queue drops records instead of blocking or reporting an error"""
+        import queue
+
+        from xrayradar.integrations.logging import _QueueHandler
+
+        records = queue.Queue(maxsize=1)
+        handler = _QueueHandler(records)
+
+        with patch.object(handler, "handleError") as mock_handle_error:
+            for i in range(3):
+                handler.handle(logging.LogRecord(
+                    "bg", logging.ERROR, "test.py", 1, "msg %d", (i,), None))
+
+        mock_handle_error.assert_not_called()
+        assert records.qsize() == 1
+        assert records.get_nowait().msg == "msg 0"
+        assert handler.dropped == 2
+
+    def test_background_teardown_with_full_queue(self, monkeypatch):
+        """Test teardown during a log storm waits for room for the stop marker"""
+        import threading
+
+        import xrayradar.integrations.logging as logging_mod
+
+        monkeypatch.setattr(logging_mod, "_QUEUE_SIZE", 5)
+        started = threading.Event()
+        release = threading.Event()
+        sent = []
+
+        def slow_send(event_data):
+            started.set()
+            release.wait(2.0)
+            sent.append(event_data["message"])
+
+        transport = Mock()
+        transport.send_event.side_effect = slow_send
+        client = ErrorTracker(transport=transport)
+        integration = setup_logging(client=client, level=logging.ERROR, background=True)
+        listener = integration._listener
+
+        logging.getLogger("storm").error("first")
+        assert started.wait(2.0)
+        for i in range(20):
+            logging.getLogger("storm").error("failure %d", i)
+        assert listener.queue.full()
+
+        threading.Timer(0.1, release.set).start()
+        integration.teardown()
+
+        assert integration._listener is None
+        assert integration._handler is None
+        assert listener._thread is None
+        assert len(sent) == 6  # one in flight plus a full queue
+
+    def test_failing_background_transport_does_not_feed_back(self):
+        """Test send failures and SDK log records never turn into more events"""
+        import time
+
+        from xrayradar.exceptions import TransportError
+        from xrayradar.transport import Transport
+
+        class FailingTransport(Transport):
+            def __init__(self):
+                self.calls = 0
+
+            def send_event(self, event_data):
+                self.calls += 1
+                raise TransportError("down")
+
+            def flush(self, timeout=None):
+                pass
+
+        inner = FailingTransport()
+        client = ErrorTracker(transport=inner, background=True)
+        integration = setup_logging(client=client)
+        try:
+            logging.getLogger("app").error("boom")
+            logging.getLogger("xrayradar.transport").error("Failed to send event")
+            client.flush(timeout=2.0)
+            time.sleep(0.1)
+            assert inner.calls == 1
+            assert client._transport.failed == 1
+        finally:
+            integration.teardown()
+
+        started = time.monotonic()
+        client.close()
+        assert time.monotonic() - started < 2.0
+
+    def test_background_teardown_flushes_client(self):
+        """Test teardown in background mode delivers drained records through the transport"""
+        from xrayradar.transport import BackgroundTransport
+
+        inner = Mock()
+        client = ErrorTracker(transport=inner, background=True)
+        assert isinstance(client._transport, BackgroundTransport)
+
+        integration = setup_logging(client=client, level=logging.ERROR, background=True)
+        try:
+            for i in range(5):
+                logging.getLogger("batch").error("failure %d", i)
+        finally:
+            integration.teardown()
+
+        sent = [call.args[0] for call in inner.send_events.call_args_list]
+        assert sum(len(batch) for batch in sent) == 5
+        assert sent[0][0]["message"] == "failure 0"
+        inner.flush.assert_called()
+        client.close()
+
+    def test_background_exception_logging_does_not_format_traceback_on_caller(self):
+        """Test logger.exception() in background mode only enqueues on the calling thread"""
+        from xrayradar.integrations.logging import _QueueHandler
+
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        integration = setup_logging(client=client, level=logging.ERROR, background=True)
+
+        try:
+            with patch.object(_QueueHandler, "format") as mock_format, \
+                    patch.object(LoggingHandler, "format") as mock_handler_format, \
+                    patch.object(client, "capture_exception") as mock_capture:
+                try:
+                    raise RuntimeError("boom")
+                except RuntimeError:
+                    logging.getLogger("bg").exception("failed %s", "job")
+                integration.teardown()
+        finally:
+            integration.teardown()
+
+        # Neither the enqueue side nor the listener renders the traceback as text
+        mock_format.assert_not_called()
+        mock_handler_format.assert_not_called()
+        exc = mock_capture.call_args[0][0]
+        assert isinstance(exc, RuntimeError)
+        assert exc.__traceback__ is not None
+        assert mock_capture.call_args[1]["message"] == "failed job"
+
+    def test_background_excluded_loggers_are_not_enqueued(self):
+        """Test excluded records are rejected by the queue handler before enqueueing"""
+        from xrayradar.integrations.logging import _QueueHandler
+
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        integration = setup_logging(
+            client=client, level=logging.ERROR, exclude_loggers={"noisy"}, background=True)
+
+        try:
+            with patch.object(_QueueHandler, "enqueue") as mock_enqueue:
+                logging.getLogger("noisy.child").error("dropped")
+                logging.getLogger("app").error("kept")
+
+            assert mock_enqueue.call_count == 1
+            assert mock_enqueue.call_args[0][0].name == "app"
+        finally:
+            integration.teardown()
+
+    def test_background_samples_before_enqueue(self):
+        """Test background mode samples records on the queue handler, not twice"""
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        integration = LoggingIntegration(
+            client=client, level=logging.INFO, background=True, sample_rate=0.5)
+        integration.setup()
+        try:
+            sample_filter = integration._handler._sample_filter
+            assert sample_filter in integration._queue_handler.filters
+            assert sample_filter not in integration._handler.filters
+        finally:
+            integration.teardown()
+
+    def test_background_disabled_client_skips_enqueue(self):
+        """Test records are not copied or enqueued while the client is disabled"""
+        import queue
+
+        from xrayradar.integrations.logging import _QueueHandler
+
+        client = ErrorTracker(dsn="https://xrayradar.com/test")
+        records = queue.Queue()
+        handler = _QueueHandler(records, client)
+
+        def log():
+            handler.handle(logging.LogRecord("app", logging.ERROR, "test.py", 1, "msg", (), None))
+
+        with patch.object(handler, "prepare", wraps=handler.prepare) as mock_prepare:
+            client._enabled = False
+            log()
+            assert records.qsize() == 0
+            mock_prepare.assert_not_called()
+
+            client._enabled = True
+            log()
+            assert records.qsize() == 1
@@ -2,9 +2,12 @@
 Tests for the error tracker models
 """
 
+import sys
 from datetime import datetime, timezone
 from unittest.mock import Mock, mock_open, patch
 
+import pytest
+
 from xrayradar.models import (
     Breadcrumb,
     Context,
@@ -15,6 +18,7 @@ from xrayradar.models import (
     StackFrame,
     User,
     _get_frame_info,
+    _new_event_id,
 )
 
 
@@ -29,10 +33,29 @@ class TestLevel:
         assert Level.INFO.value == "info"
         assert Level.DEBUG.value == "debug"
 
+    def test_level_is_string(self):
+        """Test level members compare and format as their string values"""
+        assert Level.WARNING == "warning"
+        assert str(Level.ERROR) == "error"
+        assert f"{Level.INFO}" == "info"
+        assert Level("fatal") is Level.FATAL
+
 
 class TestEvent:
     """Test cases for Event model"""
 
+    def test_event_id_is_uuid4_text(self):
+        """Test event IDs keep the dashed UUID4 format"""
+        import uuid
+
+        ids = {_new_event_id() for _ in range(100)}
+        assert len(ids) == 100
+        for event_id in ids:
+            parsed = uuid.UUID(event_id)
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+            assert str(parsed) == event_id
+
     def test_event_creation(self):
         """Test creating an event"""
         event = Event(
@@ -111,6 +134,65 @@ class TestEvent:
             assert event.exception.value == "Test error message"
             assert event.exception.module is None  # built-in exception
 
+    def test_event_from_exception_includes_chained_exceptions(self):
+        """Test __cause__ and __context__ are reported after the captured exception"""
+        try:
+            try:
+                try:
+                    raise KeyError("missing")
+                except KeyError:
+                    raise TypeError("bad type")
+            except TypeError as inner:
+                raise ValueError("outer") from inner
+        except ValueError as e:
+            event = Event.from_exception(e)
+
+        assert [info.type for info in event.exception_chain] == ["TypeError", "KeyError"]
+        assert event.exception_chain_truncated is False
+
+        values = event.to_dict()["exception"]["values"]
+        assert [v["type"] for v in values] == ["ValueError", "TypeError", "KeyError"]
+        assert values[2]["stacktrace"]["frames"]
+        assert "truncated" not in event.to_dict()["exception"]
+
+    def test_event_from_exception_respects_suppressed_context(self):
+        """Test `raise ... from None` hides the context exception"""
+        try:
+            try:
+                raise KeyError("missing")
+            except KeyError:
+                raise ValueError("clean") from None
+        except ValueError as e:
+            event = Event.from_exception(e)
+
+        assert event.exception_chain == []
+
+    def test_event_from_exception_caps_chain_depth(self):
+        """Test long exception chains are cut off and flagged as truncated"""
+        exc = ValueError("0")
+        for i in range(1, 10):
+            nxt = ValueError(str(i))
+            nxt.__cause__ = exc
+            exc = nxt
+
+        event = Event.from_exception(exc)
+
+        assert [info.value for info in event.exception_chain] == ["8", "7", "6", "5", "4"]
+        assert event.exception_chain_truncated is True
+        assert event.to_dict()["exception"]["truncated"] is True
+
+    def test_event_from_exception_stops_on_cycle(self):
+        """Test a cyclic __context__ chain does not loop forever"""
+        a = ValueError("a")
+        b = ValueError("b")
+        a.__context__ = b
+        b.__context__ = a
+
+        event = Event.from_exception(a)
+
+        assert [info.value for info in event.exception_chain] == ["b"]
+        assert event.exception_chain_truncated is False
+
     def test_event_from_exception_with_custom_message(self):
         """Test creating event from exception with custom message"""
         try:
@@ -346,6 +428,15 @@ class TestStackFrame:
         assert frame.post_context == []
         assert frame.in_app is True
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_stackframe_and_breadcrumb_are_slotted(self):
+        """Test per-frame and per-breadcrumb objects have no instance dict"""
+        frame = StackFrame(filename="test.py", function="f", lineno=1)
+        crumb = Breadcrumb(timestamp=datetime.now(timezone.utc), message="m")
+
+        assert not hasattr(frame, "__dict__")
+        assert not hasattr(crumb, "__dict__")
+
 
 class TestFrameInfoExtraction:
     """Test cases for frame info extraction"""
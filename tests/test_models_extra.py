@@ -29,3 +29,40 @@ def test_get_frame_info_uses_patched_getattribute_branch(tmp_path):
     assert info is not None
     assert info.filename == str(p)
     assert info.lineno == 2
+
+
+def test_source_context_is_read_once_per_location(tmp_path, monkeypatch):
+    import builtins
+
+    from xrayradar.models import _get_source_context
+
+    p = tmp_path / "y.py"
+    p.write_text("a = 1\nb = 2\nc = 3\n")
+
+    opened = []
+    real_open = builtins.open
+
+    def counting_open(*args, **kwargs):
+        opened.append(args[0])
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", counting_open)
+    _get_source_context.cache_clear()
+
+    class DummyCode:
+        co_filename = str(p)
+        co_name = "f"
+
+    class DummyFrame:
+        f_code = DummyCode
+        f_lineno = 2
+
+    first = _get_frame_info(DummyFrame())
+    second = _get_frame_info(DummyFrame())
+
+    assert opened == [str(p)]
+    assert first.context_line == second.context_line == "b = 2"
+    assert first.pre_context == ["a = 1"]
+    # Each frame gets its own lists, so mutating one does not leak into the cache.
+    first.pre_context.append("x")
+    assert second.pre_context == ["a = 1"]
@@ -3,7 +3,7 @@ import json
 import pytest
 import requests
 
-from xrayradar.exceptions import InvalidDsnError, TransportError
+from xrayradar.exceptions import InvalidDsnError, RateLimitedError, TransportError
 from xrayradar.transport import HttpTransport, NullTransport
 
 
@@ -44,6 +44,9 @@ def test_http_transport_sets_auth_token_header(monkeypatch):
             self.headers = {}
             self.auth = None
 
+        def mount(self, prefix, adapter):
+            pass
+
         def post(self, *a, **k):
             raise AssertionError("should not post")
 
@@ -69,6 +72,9 @@ def test_http_transport_oversize_payload_truncates(monkeypatch):
             self.headers = {}
             self.auth = None
 
+        def mount(self, prefix, adapter):
+            pass
+
         def post(self, url, data, timeout, verify):
             calls["url"] = url
             calls["data"] = data
@@ -99,6 +105,7 @@ def test_http_transport_parse_dsn_with_port():
     t = HttpTransport("https://example.com:8443/1")
     assert t.server_url == "https://example.com:8443"
     assert t.project_id == "1"
+    assert t.store_url == "https://example.com:8443/api/1/store/"
 
 
 def test_send_event_http_error_without_body(monkeypatch):
@@ -170,6 +177,9 @@ def test_http_transport_encode_error_raises(monkeypatch):
             self.headers = {}
             self.auth = None
 
+        def mount(self, prefix, adapter):
+            pass
+
         def post(self, *a, **k):
             raise AssertionError("should not post")
 
@@ -177,9 +187,188 @@ def test_http_transport_encode_error_raises(monkeypatch):
 
     t = HttpTransport("http://localhost/1")
 
-    # Force json.dumps to raise a TypeError.
-    monkeypatch.setattr(tmod.json, "dumps", lambda *a, **
+    # Force the JSON encoder to raise a TypeError.
+    monkeypatch.setattr(tmod, "_encode_json", lambda *a, **
                         k: (_ for _ in ()).throw(TypeError("bad")))
 
     with pytest.raises(TransportError):
         t.send_event({"x": object()})
+
+
+class RecordingTransport(NullTransport):
+    def __init__(self):
+        self.batches = []
+        self.closed = False
+
+    def send_events(self, events):
+        self.batches.append(list(events))
+
+    def close(self):
+        self.closed = True
+
+
+def test_background_transport_sends_from_worker_and_flushes():
+    from xrayradar.transport import BackgroundTransport
+
+    inner = RecordingTransport()
+    t = BackgroundTransport(inner)
+
+    for i in range(5):
+        t.send_event({"n": i})
+    t.flush(timeout=2.0)
+
+    sent = [e["n"] for batch in inner.batches for e in batch]
+    assert sent == [0, 1, 2, 3, 4]
+    t.close()
+    assert inner.closed is True
+
+
+def test_background_transport_drops_events_when_queue_full(monkeypatch):
+    from xrayradar.transport import BackgroundTransport
+
+    t = BackgroundTransport(RecordingTransport(), queue_size=1)
+    monkeypatch.setattr(t, "_ensure_worker", lambda: None)
+
+    t.send_event({"n": 1})
+    t.send_event({"n": 2})
+    assert t._queue.qsize() == 1
+    assert t.dropped == 1
+
+
+def test_background_transport_swallows_send_errors():
+    from xrayradar.transport import BackgroundTransport
+
+    class BadTransport(RecordingTransport):
+        def send_events(self, events):
+            raise TransportError("boom")
+
+    t = BackgroundTransport(BadTransport())
+    t.send_event({"n": 1})
+    t.flush(timeout=2.0)
+    assert t._queue.unfinished_tasks == 0
+    assert t.failed == 1
+    t.close()
+
+
+def test_background_transport_failing_event_does_not_drop_batch():
+    from xrayradar.transport import BackgroundTransport
+
+    delivered = []
+
+    class FlakyTransport(NullTransport):
+        def send_event(self, event_data):
+            if event_data["n"] == 0:
+                raise RateLimitedError("429")
+            delivered.append(event_data["n"])
+
+    t = BackgroundTransport(FlakyTransport())
+    # Queue everything before the worker starts so it drains one batch
+    t._ensure_worker = lambda: None
+    for i in range(10):
+        t.send_event({"n": i})
+    del t._ensure_worker
+    t._ensure_worker()
+    t.flush(timeout=2.0)
+    t.close()
+
+    assert delivered == list(range(1, 10))
+    assert t.failed == 1
+
+
+def test_transport_send_events_defaults_to_send_event():
+    sent = []
+
+    class ListTransport(NullTransport):
+        def send_event(self, event_data):
+            sent.append(event_data)
+
+    ListTransport().send_events([{"a": 1}, {"b": 2}])
+    assert sent == [{"a": 1}, {"b": 2}]
+
+
+def test_encode_json_falls_back_to_stdlib_when_orjson_rejects(monkeypatch):
+    import xrayradar.transport as tmod
+
+    big = {"n": 2 ** 70, 1: "int key"}
+    assert json.loads(tmod._encode_json(big)) == {"n": 2 ** 70, "1": "int key"}
+
+    monkeypatch.setattr(tmod, "orjson", None)
+    assert json.loads(tmod._encode_json({"a": "b"})) == {"a": "b"}
+
+
+def test_encode_json_raises_for_unserializable_data():
+    import xrayradar.transport as tmod
+
+    with pytest.raises(TypeError):
+        tmod._encode_json({"x": object()})
+
+
+def test_http_transport_mounts_pooled_adapter_with_retries():
+    t = HttpTransport("https://example.com/1")
+    adapter = t.session.get_adapter("https://example.com/api/1/store/")
+    assert adapter._pool_maxsize == 16
+    assert adapter.max_retries.total == 2
+    assert 503 in adapter.max_retries.status_forcelist
+    assert 429 not in adapter.max_retries.status_forcelist
+
+
+def test_post_retry_ignores_retry_after(monkeypatch):
+    import urllib3.util.retry as retry_mod
+    from urllib3.exceptions import MaxRetryError
+    from urllib3.response import HTTPResponse
+
+    import xrayradar.transport as tmod
+
+    slept = []
+    monkeypatch.setattr(retry_mod.time, "sleep", slept.append)
+    response = HTTPResponse(status=503, headers={"Retry-After": "3600"})
+
+    retry = tmod._post_retry()
+    with pytest.raises(MaxRetryError):
+        while True:
+            retry = retry.increment(method="POST", url="/api/1/store/", response=response)
+            retry.sleep(response)
+
+    # Only the short backoff, never the server's requested pause
+    assert sum(slept) < HttpTransport("https://example.com/1").timeout
+
+
+def test_post_retry_falls_back_to_method_whitelist(monkeypatch):
+    import xrayradar.transport as tmod
+
+    calls = []
+
+    def old_retry(total, backoff_factor, status_forcelist, raise_on_status,
+                  respect_retry_after_header, method_whitelist=None):
+        # urllib3 < 1.26 has no allowed_methods keyword
+        calls.append(method_whitelist)
+        return total
+
+    monkeypatch.setattr(tmod, "Retry", old_retry)
+    assert tmod._post_retry() == 2
+    assert calls == [frozenset({"POST"})]
+
+
+def test_http_transport_close_closes_session(monkeypatch):
+    t = HttpTransport("https://example.com/1")
+    called = {"n": 0}
+    monkeypatch.setattr(t.session, "close", lambda: called.__setitem__("n", 1))
+    t.close()
+    assert called["n"] == 1
+
+
+def test_debug_transport_writes_event_in_one_call(capsys):
+    import io
+
+    from xrayradar.transport import DebugTransport
+
+    stream = io.StringIO()
+    DebugTransport(stream=stream).send_event({"event_id": "abc"})
+    out = stream.getvalue()
+    assert out.startswith("[ErrorTracker] Event: {")
+    assert out.endswith("}\n")
+    assert json.loads(out[len("[ErrorTracker] Event: "):]) == {"event_id": "abc"}
+
+    # Defaults to stdout, resolved at send time
+    DebugTransport().send_event({"event_id": "def"})
+    assert '"event_id": "def"' in capsys.readouterr().out